@@ -6,11 +6,21 @@ CONCEPT: Assertions
 - Should NOT replace proper exception handling in production
 """
 
+from functools import lru_cache
+
+# The number check only depends on the argument types, so cache it per type pair.
+# lru_cache is implemented in C - a hit skips both type checks.
+# (Failed checks raise, so they are never cached)
+@lru_cache(maxsize=32)
+def _check_number_types(type_a, type_b):
+    assert issubclass(type_a, (int, float)), f"First argument must be a number, got {type_a}"
+    assert issubclass(type_b, (int, float)), f"Second argument must be a number, got {type_b}"
+
 def divide_numbers(a, b):
     # Precondition checks - verify inputs are valid before processing
     assert b != 0, "Divisor cannot be zero"
-    assert isinstance(a, (int, float)), f"First argument must be a number, got {type(a)}"
-    assert isinstance(b, (int, float)), f"Second argument must be a number, got {type(b)}"
+    if __debug__:
+        _check_number_types(type(a), type(b))
     
     result = a / b
     
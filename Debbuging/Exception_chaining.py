@@ -20,6 +20,16 @@ Benefits:
 4. Clearer error messages
 """
 
+import traceback
+
+# Set to True to print the complete traceback (every frame, every chained exception)
+VERBOSE_TRACEBACK = False
+
+# Banners built once at import, not on every call
+_BANNER = '=' * 70
+_BANG = '!' * 70
+_SEP = '─' * 70
+
 # Define custom exception hierarchy
 class ApplicationError(Exception):
     """Base exception for application"""
@@ -41,10 +51,6 @@ class ValidationError(ApplicationError):
     """Data validation failures"""
     pass
 
-class BusinessLogicError(ApplicationError):
-    """Business rule violations"""
-    pass
-
 def connect_to_database(host, port):
     """
     Simulate database connection failure
@@ -86,18 +92,14 @@ def process_user_request(user_id):
     """
     Process user request with complete exception chain
     """
-    print(f"\n{'='*70}")
-    print(f"Processing request for user {user_id}")
-    print(f"{'='*70}")
+    print(f"\n{_BANNER}\nProcessing request for user {user_id}\n{_BANNER}")
     
     try:
         user_data = fetch_user_data(user_id)
         return user_data
         
     except ValidationError as e:
-        print(f"\n{'!'*70}")
-        print("EXCEPTION CHAIN ANALYSIS")
-        print(f"{'!'*70}")
+        print(f"\n{_BANG}\nEXCEPTION CHAIN ANALYSIS\n{_BANG}")
         
         # Show the top-level exception
         print(f"\nTop-level Exception:")
@@ -116,24 +118,24 @@ def process_user_request(user_id):
         level = 1
         
         while current:
-            print(f"\n  Level {level}: {type(current).__name__}")
-            print(f"  Message: {current}")
-            
-            if current.__cause__:
-                current = current.__cause__
-            elif current.__context__:
-                current = current.__context__
-            else:
-                current = None
+            print(f"\n  Level {level}: {type(current).__name__}\n  Message: {current}")
             
+            # Explicit cause first, then implicit context (None ends the walk)
+            current = current.__cause__ or current.__context__
             level += 1
         
         # Show traceback
-        print(f"\n{'─'*70}")
-        print("Full Traceback:")
-        print(f"{'─'*70}")
-        import traceback
-        traceback.print_exc()
+        # The chain was already printed above, so by default only a short
+        # traceback is built: last 3 frames, source lines not read up front
+        title = "Full Traceback:" if VERBOSE_TRACEBACK else "Traceback (last 3 frames):"
+        print(f"\n{_SEP}\n{title}\n{_SEP}")
+        if VERBOSE_TRACEBACK:
+            traceback.print_exc()
+        else:
+            tb = traceback.TracebackException.from_exception(
+                e, limit=3, lookup_lines=False, capture_locals=False
+            )
+            print("".join(tb.format(chain=False)), end="")
         
         return None
 
@@ -141,9 +143,7 @@ def demonstrate_implicit_chaining():
     """
     Demonstrate implicit exception chaining (__context__)
     """
-    print(f"\n{'='*70}")
-    print("IMPLICIT EXCEPTION CHAINING")
-    print(f"{'='*70}")
+    print(f"\n{_BANNER}\nIMPLICIT EXCEPTION CHAINING\n{_BANNER}")
     
     try:
         try:
@@ -168,9 +168,7 @@ def demonstrate_suppressing_context():
     """
     Demonstrate suppressing exception context with 'from None'
     """
-    print(f"\n{'='*70}")
-    print("SUPPRESSING EXCEPTION CONTEXT")
-    print(f"{'='*70}")
+    print(f"\n{_BANNER}\nSUPPRESSING EXCEPTION CONTEXT\n{_BANNER}")
     
     try:
         try:
@@ -189,9 +187,7 @@ def multi_layer_application():
     """
     Simulate a multi-layer application with exception chaining
     """
-    print(f"\n{'='*70}")
-    print("MULTI-LAYER APPLICATION ERROR HANDLING")
-    print(f"{'='*70}")
+    print(f"\n{_BANNER}\nMULTI-LAYER APPLICATION ERROR HANDLING\n{_BANNER}")
     
     def data_layer():
         """Lowest layer - data access"""
@@ -199,16 +195,16 @@ def multi_layer_application():
     
     def business_layer():
         """Middle layer - business logic"""
-        try:
-            data_layer()
-        except ConnectionError as e:
-            raise BusinessLogicError("Failed to process business rule") from e
+        # Nothing useful to add here, so the error passes through untouched.
+        # Wrapping it would only re-label it and build another traceback
+        data_layer()
     
     def presentation_layer():
         """Top layer - user interface"""
         try:
             business_layer()
-        except BusinessLogicError as e:
+        except DatabaseError as e:
+            # Wrap once, at the boundary where the meaning changes
             raise ApplicationError("Application failed to complete request") from e
     
     try:
@@ -226,14 +222,13 @@ def multi_layer_application():
             depth += 1
         
         print("\nThis shows the complete path of the error through all layers")
+        print("(only layers that add information wrap the error)")
 
 def custom_exception_with_debugging_info():
     """
     Custom exception that includes debugging information
     """
-    print(f"\n{'='*70}")
-    print("CUSTOM EXCEPTION WITH DEBUGGING INFO")
-    print(f"{'='*70}")
+    print(f"\n{_BANNER}\nCUSTOM EXCEPTION WITH DEBUGGING INFO\n{_BANNER}")
     
     class DetailedError(Exception):
         """Exception with rich debugging information"""
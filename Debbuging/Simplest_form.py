@@ -7,14 +7,14 @@ CONCEPT: Print Debugging
 """
 
 def calculate_average(numbers):
-    # Print input to verify what data we're receiving
-    print(f"Input numbers: {numbers}")
-    
     total = sum(numbers)
-    print(f"Total: {total}")  # Track intermediate calculation
-    
     count = len(numbers)
-    print(f"Count: {count}")  # Verify count is correct
+    
+    # Print input and intermediate values in one call - one write instead of three.
+    # Still printed before the division, so they show up even if count is 0
+    print(f"Input numbers: {numbers}\n"  # Verify what data we're receiving
+          f"Total: {total}\n"            # Track intermediate calculation
+          f"Count: {count}")              # Verify count is correct
     
     average = total / count
     print(f"Average: {average}")  # Final result before return
@@ -19,24 +19,37 @@ Benefits:
 """
 
 import time
+import tracemalloc
 from contextlib import contextmanager
 import sys
 
+# Banner built once at import, not on every enter/exit
+_BANNER = '=' * 60
+
 @contextmanager
-def debug_timer(operation_name):
+def debug_timer(operation_name, track_memory=False):
     """
     Context manager to measure and log execution time
     
     Usage:
         with debug_timer("My Operation"):
             # code to time
+    
+    Pass track_memory=True to also report peak memory allocated
+    inside the block (uses tracemalloc, which slows the block down)
     """
-    print(f"{'='*60}")
-    print(f"Starting: {operation_name}")
-    print(f"{'='*60}")
+    sys.stdout.write(f"{_BANNER}\nStarting: {operation_name}\n{_BANNER}\n")
     
-    start_time = time.time()
-    start_memory = sys.getsizeof(locals())  # Rough memory estimate
+    # perf_counter_ns(): monotonic, integer nanoseconds (time.time() can jump)
+    start_time = time.perf_counter_ns()
+    
+    # Memory tracking is opt-in - the default path does no extra work
+    if track_memory:
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        start_memory = tracemalloc.get_traced_memory()[0]
     
     try:
         # This is where the 'with' block code runs
@@ -48,13 +61,16 @@ def debug_timer(operation_name):
         
     finally:
         # This always runs, even if exception occurred
-        end_time = time.time()
-        elapsed = end_time - start_time
+        end_time = time.perf_counter_ns()
+        elapsed = (end_time - start_time) / 1e9
         
-        print(f"{'='*60}")
-        print(f"Finished: {operation_name}")
-        print(f"Time taken: {elapsed:.4f} seconds")
-        print(f"{'='*60}\n")
+        report = f"{_BANNER}\nFinished: {operation_name}\nTime taken: {elapsed:.4f} seconds\n"
+        if track_memory:
+            peak_memory = tracemalloc.get_traced_memory()[1] - start_memory
+            if started_tracing:
+                tracemalloc.stop()
+            report += f"Peak memory: {peak_memory:,} bytes\n"
+        sys.stdout.write(f"{report}{_BANNER}\n\n")
 
 @contextmanager
 def debug_section(section_name, verbose=True):
@@ -63,15 +79,15 @@ def debug_section(section_name, verbose=True):
     Tracks entry, exit, and any exceptions
     """
     if verbose:
-        print(f"\n>>> Entering: {section_name}")
+        sys.stdout.write(f"\n>>> Entering: {section_name}\n")
     
     try:
         yield
         if verbose:
-            print(f"<<< Exiting: {section_name} (Success)")
+            sys.stdout.write(f"<<< Exiting: {section_name} (Success)\n")
     except Exception as e:
         if verbose:
-            print(f"<<< Exiting: {section_name} (Error: {e})")
+            sys.stdout.write(f"<<< Exiting: {section_name} (Error: {e})\n")
         raise
 
 @contextmanager
@@ -155,20 +171,23 @@ class DebugContext:
     Class-based context manager for comparison
     Same as @contextmanager but more explicit
     """
+    __slots__ = ('name', 'start_time')  # No per-instance __dict__
+    
     def __init__(self, name):
         self.name = name
     
     def __enter__(self):
-        print(f"[ENTER] {self.name}")
-        self.start_time = time.time()
+        sys.stdout.write(f"[ENTER] {self.name}\n")
+        self.start_time = time.perf_counter_ns()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        elapsed = time.time() - self.start_time
-        print(f"[EXIT] {self.name} (took {elapsed:.4f}s)")
+        elapsed = (time.perf_counter_ns() - self.start_time) / 1e9
+        report = f"[EXIT] {self.name} (took {elapsed:.4f}s)\n"
         
         if exc_type:
-            print(f"[EXCEPTION] {exc_type.__name__}: {exc_val}")
+            report += f"[EXCEPTION] {exc_type.__name__}: {exc_val}\n"
+        sys.stdout.write(report)
         
         return False  # Don't suppress exceptions
 
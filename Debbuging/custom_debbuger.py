@@ -24,12 +24,24 @@ Benefits:
 """
 
 import functools
+import inspect
+import reprlib
+import sys
 import time
 from typing import Any
 
 # Global flag to enable/disable debugging
 DEBUG_ENABLED = True
 
+# Set to False to log calls without formatting their arguments
+DEBUG_SHOW_ARGS = True
+
+# Bounded repr: a 10,000-item list shows as [0, 1, 2, 3, 4, ...]
+# instead of walking (and printing) the whole structure
+_arg_repr = reprlib.Repr()
+_arg_repr.maxlist = 5
+_arg_repr.maxdict = 5
+
 def debug(func):
     """
     Decorator that logs function calls, arguments, return values, and exceptions
@@ -40,9 +52,12 @@ def debug(func):
             return func(*args, **kwargs)
         
         # Format arguments for display
-        args_repr = [repr(a) for a in args]
-        kwargs_repr = [f"{k}={v!r}" for k, v in kwargs.items()]
-        signature = ", ".join(args_repr + kwargs_repr)
+        if DEBUG_SHOW_ARGS:
+            args_repr = [_arg_repr.repr(a) for a in args]
+            kwargs_repr = [f"{k}={_arg_repr.repr(v)}" for k, v in kwargs.items()]
+            signature = ", ".join(args_repr + kwargs_repr)
+        else:
+            signature = "..."
         
         print(f"\n{'='*60}")
         print(f"Calling {func.__name__}({signature})")
@@ -58,8 +73,10 @@ def debug(func):
             return result
             
         except Exception as e:
-            print(f"{func.__name__} raised {type(e).__name__}: {e}")
-            print(f"{'='*60}")
+            # One write, on stdout with the rest of the report; no traceback
+            # is formatted here.
+            # Bare 'raise' re-raises the original exception with its traceback intact
+            sys.stdout.write(f"{func.__name__} raised {type(e).__name__}: {e}\n{'='*60}\n")
             raise
     
     return wrapper
@@ -73,12 +90,13 @@ def timing_debug(func):
         if not DEBUG_ENABLED:
             return func(*args, **kwargs)
         
-        start_time = time.time()
+        # perf_counter_ns(): monotonic, integer nanoseconds (time.time() can jump)
+        start_time = time.perf_counter_ns()
         
         print(f"\n[TIMING] Starting {func.__name__}")
         result = func(*args, **kwargs)
         
-        elapsed = time.time() - start_time
+        elapsed = (time.perf_counter_ns() - start_time) / 1e9
         print(f"[TIMING] {func.__name__} took {elapsed:.4f} seconds")
         
         return result
@@ -108,22 +126,41 @@ def validate_types(**type_hints):
             return x + y
     """
     def decorator(func):
+        # The signature never changes, so inspect it once at decoration time
+        # instead of on every call
+        sig = inspect.signature(func)
+        
+        # (arg_name, expected_type, exact_types, position)
+        # position is None for keyword-only arguments
+        positional_kinds = (inspect.Parameter.POSITIONAL_ONLY,
+                            inspect.Parameter.POSITIONAL_OR_KEYWORD)
+        checks = []
+        for index, (name, param) in enumerate(sig.parameters.items()):
+            if name in type_hints:
+                expected_type = type_hints[name]
+                exact_types = frozenset(expected_type if isinstance(expected_type, tuple)
+                                        else (expected_type,))
+                position = index if param.kind in positional_kinds else None
+                checks.append((name, expected_type, exact_types, position))
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            # Get function's argument names
-            import inspect
-            sig = inspect.signature(func)
-            bound_args = sig.bind(*args, **kwargs)
-            
             # Validate types
-            for arg_name, expected_type in type_hints.items():
-                if arg_name in bound_args.arguments:
-                    value = bound_args.arguments[arg_name]
-                    if not isinstance(value, expected_type):
-                        raise TypeError(
-                            f"{func.__name__}() argument '{arg_name}' must be "
-                            f"{expected_type.__name__}, got {type(value).__name__}"
-                        )
+            for arg_name, expected_type, exact_types, position in checks:
+                if position is not None and position < len(args):
+                    value = args[position]
+                elif arg_name in kwargs:
+                    value = kwargs[arg_name]
+                else:
+                    continue  # Not passed - default value is used
+                
+                # Exact type match is a quick set lookup; isinstance() is only
+                # needed for subclasses (e.g. bool for int) and ABCs
+                if type(value) not in exact_types and not isinstance(value, expected_type):
+                    raise TypeError(
+                        f"{func.__name__}() argument '{arg_name}' must be "
+                        f"{expected_type.__name__}, got {type(value).__name__}"
+                    )
             
             return func(*args, **kwargs)
         
@@ -140,10 +177,13 @@ def calculate_power(base, exponent):
 @debug
 @timing_debug
 def fibonacci(n):
-    """Calculate nth Fibonacci number (recursive)"""
-    if n <= 1:
-        return n
-    return fibonacci(n - 1) + fibonacci(n - 2)
+    """Calculate nth Fibonacci number (iterative)"""
+    # A recursive version would go through both decorators on every one of
+    # its ~2^n calls - the loop keeps it to one debug/timing report per call
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
 
 @call_counter
 @debug
@@ -175,8 +215,8 @@ print(f"Result: {result}")
 result = calculate_power(5, 0)
 print(f"Result: {result}")
 
-print("\n2. Recursive Function (shows call stack)")
-print("Note: This will show all recursive calls")
+print("\n2. Stacked Decorators (debug + timing)")
+print("Note: Both decorators report once per call")
 result = fibonacci(5)
 print(f"Final result: {result}")
 
@@ -19,11 +19,117 @@ Debugging Tools:
 """
 
 import threading
+import itertools
+from collections import defaultdict
 import logging
+import logging.handlers
 import time
-from queue import Queue, Empty
+from concurrent.futures import ThreadPoolExecutor
+from queue import SimpleQueue
 import random
 
+class DeadlockOrderError(RuntimeError):
+    """Acquiring a lock would break the lock order other threads rely on"""
+    pass
+
+class TrackedLock:
+    """
+    Lock that checks lock ordering before every acquire
+    
+    When a thread takes this lock while holding others, an edge
+    held_lock -> this_lock goes into a graph shared by all TrackedLocks.
+    If the new edge would close a cycle, two threads could end up waiting
+    on each other forever - DeadlockOrderError is raised instead of blocking.
+    """
+    # lock -> locks that have been acquired while holding it
+    _order_graph = defaultdict(set)
+    _graph_lock = threading.Lock()
+    _thread_state = threading.local()
+    
+    def __init__(self, name):
+        self.name = name
+        self._lock = threading.Lock()
+    
+    def __repr__(self):
+        return f"TrackedLock({self.name!r})"
+    
+    @classmethod
+    def _held_locks(cls):
+        """Locks the current thread holds, in acquisition order"""
+        held = getattr(cls._thread_state, 'held', None)
+        if held is None:
+            held = cls._thread_state.held = []
+        return held
+    
+    def _reaches(self, target):
+        """Is there a path self -> ... -> target in the lock graph? (iterative DFS)"""
+        stack = [self]
+        visited = {self}
+        while stack:
+            lock = stack.pop()
+            if lock is target:
+                return True
+            for next_lock in self._order_graph[lock]:
+                if next_lock not in visited:
+                    visited.add(next_lock)
+                    stack.append(next_lock)
+        return False
+    
+    def acquire(self):
+        held = self._held_locks()
+        with self._graph_lock:
+            for held_lock in held:
+                if self in self._order_graph[held_lock]:
+                    continue  # Order already known to be fine
+                # Adding held_lock -> self closes a cycle if self already leads to held_lock
+                if self._reaches(held_lock):
+                    raise DeadlockOrderError(
+                        f"acquiring {self.name} while holding {held_lock.name} "
+                        f"reverses the established lock order"
+                    )
+                self._order_graph[held_lock].add(self)
+        self._lock.acquire()
+        held.append(self)
+    
+    def release(self):
+        self._held_locks().remove(self)
+        self._lock.release()
+    
+    def __enter__(self):
+        self.acquire()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+        return False
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    File handler that lets records collect in a 64 KiB buffer
+    
+    StreamHandler flushes after every record - one write() syscall each.
+    This handler only flushes on ERROR and above, and when closed
+    (logging.shutdown() closes every handler at interpreter exit)
+    """
+    buffer_size = 64 * 1024
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=self.errors)
+    
+    def flush(self):
+        # Called by emit() after every record - let the buffer fill instead
+        pass
+    
+    def emit(self, record):
+        super().emit(record)
+        if record.levelno >= logging.ERROR:
+            super().flush()
+    
+    def close(self):
+        super().flush()
+        super().close()
+
 class ThreadDebugger:
     """
     Thread-safe debugger with comprehensive logging
@@ -32,49 +138,87 @@ class ThreadDebugger:
         # Configure logger
         self.logger = logging.getLogger('ThreadDebugger')
         self.logger.setLevel(logging.DEBUG)
+        # Records are handled here only - don't pass them on to the root logger too
+        self.logger.propagate = False
         
-        # File handler
-        file_handler = logging.FileHandler(log_file, mode='w')
-        file_formatter = logging.Formatter(
-            '%(asctime)s.%(msecs)03d - Thread-%(thread)d(%(threadName)s) - '
-            '%(levelname)s - %(message)s',
-            datefmt='%H:%M:%S'
-        )
-        file_handler.setFormatter(file_formatter)
+        # getLogger() returns the same logger every time, so only the first
+        # ThreadDebugger adds handlers (otherwise every record is written once
+        # per instance). Later instances share them and leave close() to the owner
+        self._listener = None
+        if not self.logger.handlers:
+            # File handler (buffered - see BufferedFileHandler)
+            file_handler = BufferedFileHandler(log_file, mode='w')
+            file_formatter = logging.Formatter(
+                '%(asctime)s.%(msecs)03d - Thread-%(thread)d(%(threadName)s) - '
+                '%(levelname)s - %(message)s',
+                datefmt='%H:%M:%S'
+            )
+            file_handler.setFormatter(file_formatter)
         
-        # Console handler
-        console_handler = logging.StreamHandler()
-        console_formatter = logging.Formatter(
-            '[%(threadName)-12s] %(levelname)-8s %(message)s'
-        )
-        console_handler.setFormatter(console_formatter)
+            # Console handler
+            console_handler = logging.StreamHandler()
+            console_formatter = logging.Formatter(
+                '[%(threadName)-12s] %(levelname)-8s %(message)s'
+            )
+            console_handler.setFormatter(console_formatter)
         
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
+            # Workers only put records on a queue; one listener thread does the
+            # formatting and file/console writes, so worker threads never block on I/O
+            self._log_queue = SimpleQueue()
+            self._queue_handler = logging.handlers.QueueHandler(self._log_queue)
+            self.logger.addHandler(self._queue_handler)
+            self._listener = logging.handlers.QueueListener(
+                self._log_queue, file_handler, console_handler,
+                respect_handler_level=True
+            )
+            self._listener.start()
         
-        # Lock for synchronizing shared resources
-        self.lock = threading.Lock()
-        self.shared_counter = 0
+        # Shared counter without a lock: itertools.count's next() runs in C
+        # as a single step, so two threads can never get the same value
+        self._counter = itertools.count(1)
+        
+        # Items processed per worker - each worker only writes its own key
+        self._processed = {}
+    
+    def close(self):
+        """Write out any queued log records, stop the listener thread and close the log file"""
+        if self._listener is None:
+            return  # Handlers belong to another ThreadDebugger
+        self._listener.stop()
+        for handler in self._listener.handlers:
+            handler.close()
+        self.logger.removeHandler(self._queue_handler)
+        self._listener = None
+    
+    @property
+    def shared_counter(self):
+        """Total items processed by all workers"""
+        return sum(self._processed.values())
     
     def worker(self, worker_id, queue):
         """
         Worker thread that processes items from queue
+        
+        Log calls pass %-style arguments instead of f-strings, so the
+        message is only formatted if a handler actually emits it
         """
         thread_id = threading.get_ident()
-        self.logger.debug(f"Worker {worker_id} started (Thread ID: {thread_id})")
+        self.logger.debug("Worker %d started (Thread ID: %d)", worker_id, thread_id)
         
         items_processed = 0
         
         while True:
             try:
-                # Get item from queue with timeout
-                item = queue.get(timeout=1)
+                # Block until an item arrives - no timeout, so idle workers
+                # sleep instead of waking up every second.
+                # Shutdown is signalled by a None sentinel
+                item = queue.get()
                 
                 if item is None:
-                    self.logger.debug(f"Worker {worker_id} received shutdown signal")
+                    self.logger.debug("Worker %d received shutdown signal", worker_id)
                     break
                 
-                self.logger.info(f"Worker {worker_id} processing item: {item}")
+                self.logger.info("Worker %d processing item: %s", worker_id, item)
                 
                 # Simulate work with random delay
                 processing_time = random.uniform(0.1, 0.5)
@@ -83,28 +227,23 @@ class ThreadDebugger:
                 # Process the item
                 result = item * 2
                 
-                # Update shared counter (needs synchronization)
-                with self.lock:
-                    self.shared_counter += 1
-                    counter_value = self.shared_counter
+                # Update shared counter (atomic, no lock needed)
+                counter_value = next(self._counter)
                 
-                self.logger.debug(
-                    f"Worker {worker_id} completed item {item} -> {result} "
-                    f"(took {processing_time:.3f}s, total processed: {counter_value})"
-                )
+                # Check the level first so the message is only built when it's emitted
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(
+                        "Worker %d completed item %s -> %s (took %.3fs, total processed: %d)",
+                        worker_id, item, result, processing_time, counter_value
+                    )
                 
                 items_processed += 1
-                queue.task_done()
+                self._processed[worker_id] = items_processed
                 
-            except Empty:
-                self.logger.debug(f"Worker {worker_id} queue empty, waiting...")
-                continue
-            
             except Exception as e:
-                self.logger.error(f"Worker {worker_id} error: {e}", exc_info=True)
-                queue.task_done()
+                self.logger.error("Worker %d error: %s", worker_id, e, exc_info=True)
         
-        self.logger.info(f"Worker {worker_id} terminated (processed {items_processed} items)")
+        self.logger.info("Worker %d terminated (processed %d items)", worker_id, items_processed)
 
 def demonstrate_race_condition():
     """
@@ -114,6 +253,13 @@ def demonstrate_race_condition():
     print("RACE CONDITION DEMONSTRATION")
     print("="*70)
     
+    # Busy work between reading and writing the counter. CPU work (not
+    # time.sleep) keeps this a test of thread interleaving, not of sleep syscalls
+    work_steps = 256
+    increments_per_thread = 10_000
+    num_threads = 5
+    expected = increments_per_thread * num_threads
+    
     class UnsafeCounter:
         """Counter without thread safety"""
         def __init__(self):
@@ -122,101 +268,112 @@ def demonstrate_race_condition():
         def increment_unsafe(self):
             """NOT thread-safe - race condition!"""
             temp = self.count
-            time.sleep(0.0001)  # Simulate some processing
+            for _ in range(work_steps):  # Simulate some processing
+                pass
             self.count = temp + 1
         
         def increment_safe(self, lock):
             """Thread-safe with lock"""
             with lock:
                 temp = self.count
-                time.sleep(0.0001)
+                for _ in range(work_steps):
+                    pass
                 self.count = temp + 1
     
-    # Test unsafe version
-    print("\nUnsafe increment (race condition):")
-    unsafe_counter = UnsafeCounter()
-    
-    def unsafe_worker():
-        for _ in range(100):
-            unsafe_counter.increment_unsafe()
-    
-    threads = [threading.Thread(target=unsafe_worker) for _ in range(5)]
-    for t in threads:
-        t.start()
-    for t in threads:
-        t.join()
-    
-    print(f"Expected: 500, Got: {unsafe_counter.count}")
-    print(f"Lost updates due to race condition: {500 - unsafe_counter.count}")
-    
-    # Test safe version
-    print("\nSafe increment (with lock):")
-    safe_counter = UnsafeCounter()
-    lock = threading.Lock()
-    
-    def safe_worker():
-        for _ in range(100):
-            safe_counter.increment_safe(lock)
-    
-    threads = [threading.Thread(target=safe_worker) for _ in range(5)]
-    for t in threads:
-        t.start()
-    for t in threads:
-        t.join()
+    # One pool of threads is reused for both tests instead of starting new threads each time
+    with ThreadPoolExecutor(max_workers=num_threads) as pool:
+        # Test unsafe version
+        print("\nUnsafe increment (race condition):")
+        unsafe_counter = UnsafeCounter()
+        
+        def unsafe_worker():
+            for _ in range(increments_per_thread):
+                unsafe_counter.increment_unsafe()
+        
+        # Waiting on every future = joining the threads
+        for future in [pool.submit(unsafe_worker) for _ in range(num_threads)]:
+            future.result()
+        
+        print(f"Expected: {expected}, Got: {unsafe_counter.count}")
+        print(f"Lost updates due to race condition: {expected - unsafe_counter.count}")
+        
+        # Test safe version
+        print("\nSafe increment (with lock):")
+        safe_counter = UnsafeCounter()
+        lock = threading.Lock()
+        
+        def safe_worker():
+            for _ in range(increments_per_thread):
+                safe_counter.increment_safe(lock)
+        
+        for future in [pool.submit(safe_worker) for _ in range(num_threads)]:
+            future.result()
     
-    print(f"Expected: 500, Got: {safe_counter.count}")
+    print(f"Expected: {expected}, Got: {safe_counter.count}")
 
 def demonstrate_deadlock_detection():
     """
-    Demonstrate potential deadlock situation
+    Demonstrate deadlock detection with lock-order tracking
     """
     print("\n" + "="*70)
     print("DEADLOCK DETECTION")
     print("="*70)
     
-    lock1 = threading.Lock()
-    lock2 = threading.Lock()
+    # TrackedLock records the order locks are taken in and refuses
+    # an acquire that would reverse it (instead of hanging forever)
+    lock1 = TrackedLock("lock1")
+    lock2 = TrackedLock("lock2")
     
     logger = logging.getLogger('DeadlockDemo')
     logger.setLevel(logging.DEBUG)
+    logger.propagate = False
     
-    handler = logging.StreamHandler()
-    formatter = logging.Formatter('[%(threadName)s] %(message)s')
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
+    # Add the handler only once, even if this demo runs several times
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        formatter = logging.Formatter('[%(threadName)s] %(message)s')
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
     
     def thread1_func():
-        logger.info("Acquiring lock1...")
-        with lock1:
-            logger.info("Got lock1")
-            time.sleep(0.1)
-            
-            logger.info("Trying to acquire lock2...")
-            # This could deadlock if thread2 has lock2 and wants lock1
-            with lock2:
-                logger.info("Got lock2")
-    
-    def thread2_func():
-        logger.info("Acquiring lock2...")
-        with lock2:
-            logger.info("Got lock2")
-            time.sleep(0.1)
-            
-            logger.info("Trying to acquire lock1...")
-            # This could deadlock if thread1 has lock1 and wants lock2
+        try:
+            logger.info("Acquiring lock1...")
             with lock1:
                 logger.info("Got lock1")
+                time.sleep(0.1)
+                
+                logger.info("Trying to acquire lock2...")
+                # This could deadlock if thread2 has lock2 and wants lock1
+                with lock2:
+                    logger.info("Got lock2")
+        except DeadlockOrderError as e:
+            logger.error("Deadlock prevented: %s", e)
     
-    print("\nNote: This might deadlock! (Ctrl+C to interrupt if it hangs)")
+    def thread2_func():
+        try:
+            logger.info("Acquiring lock2...")
+            with lock2:
+                logger.info("Got lock2")
+                time.sleep(0.1)
+                
+                logger.info("Trying to acquire lock1...")
+                # This could deadlock if thread1 has lock1 and wants lock2
+                with lock1:
+                    logger.info("Got lock1")
+        except DeadlockOrderError as e:
+            logger.error("Deadlock prevented: %s", e)
+    
+    print("\nThe two threads take the same locks in opposite order.")
+    print("With plain Locks this can hang forever; TrackedLock detects the")
+    print("reversed order and raises DeadlockOrderError instead.")
     print("Solution: Always acquire locks in the same order\n")
     
-    # Comment out to avoid actual deadlock
-    # t1 = threading.Thread(target=thread1_func, name="Thread-1")
-    # t2 = threading.Thread(target=thread2_func, name="Thread-2")
-    # t1.start()
-    # t2.start()
-    # t1.join(timeout=2)
-    # t2.join(timeout=2)
+    t1 = threading.Thread(target=thread1_func, name="Thread-1")
+    t2 = threading.Thread(target=thread2_func, name="Thread-2")
+    t1.start()
+    t2.start()
+    t1.join(timeout=2)
+    t2.join(timeout=2)
 
 def main():
     """
@@ -227,42 +384,38 @@ def main():
     print("="*70)
     
     debugger = ThreadDebugger()
-    queue = Queue()
+    # SimpleQueue: C-implemented, no task_done()/join() bookkeeping.
+    # Completion is signalled by one None sentinel per worker instead
+    queue = SimpleQueue()
     
-    # Create worker threads
+    # Create worker threads (a pool, so the threads can be reused)
     num_workers = 3
-    threads = []
     
     print(f"\nStarting {num_workers} worker threads...")
     
-    for i in range(num_workers):
-        t = threading.Thread(
-            target=debugger.worker,
-            args=(i, queue),
-            name=f"Worker-{i}"
-        )
-        t.start()
-        threads.append(t)
-    
-    # Add items to queue
-    print("\nAdding items to queue...")
-    num_items = 10
-    for item in range(num_items):
-        queue.put(item)
-        debugger.logger.info(f"Main thread queued item: {item}")
-    
-    # Wait for all items to be processed
-    print("\nWaiting for workers to complete...")
-    queue.join()
-    
-    # Send shutdown signal to workers
-    print("\nShutting down workers...")
-    for _ in threads:
-        queue.put(None)
-    
-    # Wait for all threads to finish
-    for t in threads:
-        t.join()
+    with ThreadPoolExecutor(max_workers=num_workers, thread_name_prefix="Worker") as pool:
+        for i in range(num_workers):
+            pool.submit(debugger.worker, i, queue)
+        
+        # Add items to queue
+        print("\nAdding items to queue...")
+        num_items = 10
+        for item in range(num_items):
+            queue.put(item)
+        debugger.logger.info("Main thread queued %d items", num_items)
+        
+        # Send shutdown signal to workers - the queue is FIFO, so each
+        # worker only sees its None after all real items are taken
+        print("\nShutting down workers...")
+        for _ in range(num_workers):
+            queue.put(None)
+        
+        print("\nWaiting for workers to complete...")
+    
+    # Leaving the 'with' block waits for all workers to finish
+    
+    # Flush remaining log records before printing the summary
+    debugger.close()
     
     print(f"\nAll workers completed!")
     print(f"Total items processed (shared counter): {debugger.shared_counter}")
@@ -21,94 +21,136 @@ Uses:
 """
 
 import inspect
+import linecache
+import reprlib
 import sys
 from pprint import pprint
 
-def show_call_stack():
+# Shortens values while it builds their repr, so a huge list or dict
+# costs the same to show as a small one
+_truncator = reprlib.Repr()
+_truncator.maxstring = 50
+_truncator.maxother = 50
+_truncator.maxlist = 4
+_truncator.maxdict = 4
+
+def _walk_frames(frame):
+    """
+    Yield a frame and every frame that called it, innermost first
+    
+    Follows f_back directly - unlike inspect.stack(), no source files are read
+    """
+    while frame is not None:
+        yield frame
+        frame = frame.f_back
+
+def show_call_stack(stack=None):
     """
     Display detailed information about the current call stack
+    
+    Pass a list from inspect.stack() to reuse it instead of walking the stack again
     """
     print("\n" + "="*70)
     print("CALL STACK ANALYSIS")
     print("="*70)
     
-    # Get the current frame
-    frame = inspect.currentframe()
-    
     # Get all frames in the stack
-    stack = inspect.stack()
+    if stack is None:
+        stack = inspect.stack()
     
     print(f"\nTotal frames in stack: {len(stack)}\n")
     
+    separator = '─' * 70
     for i, frame_info in enumerate(stack):
-        print(f"{'─'*70}")
-        print(f"Frame {i}: {frame_info.function}")
-        print(f"{'─'*70}")
-        print(f"  File: {frame_info.filename}")
-        print(f"  Line: {frame_info.lineno}")
-        print(f"  Function: {frame_info.function}")
+        # Collect the frame's lines and write them with one call
+        lines = [
+            separator,
+            f"Frame {i}: {frame_info.function}",
+            separator,
+            f"  File: {frame_info.filename}",
+            f"  Line: {frame_info.lineno}",
+            f"  Function: {frame_info.function}",
+        ]
         
         # Show code context
         if frame_info.code_context:
-            print(f"  Code: {frame_info.code_context[0].strip()}")
+            lines.append(f"  Code: {frame_info.code_context[0].strip()}")
         
         # Show local variables
         local_vars = frame_info.frame.f_locals
-        print(f"  Local variables ({len(local_vars)}):")
+        lines.append(f"  Local variables ({len(local_vars)}):")
         for var_name, var_value in local_vars.items():
             # Skip internal variables and large objects
             if not var_name.startswith('_'):
-                value_str = str(var_value)
-                if len(value_str) > 50:
-                    value_str = value_str[:50] + "..."
-                print(f"    {var_name} = {value_str} ({type(var_value).__name__})")
+                try:
+                    value_str = _truncator.repr(var_value)
+                except Exception as e:
+                    value_str = f"<repr() failed: {type(e).__name__}>"
+                lines.append(f"    {var_name} = {value_str} ({type(var_value).__name__})")
         
-        print()
+        sys.stdout.write("\n".join(lines) + "\n\n")
 
 def get_caller_info():
     """
     Get information about the function that called this one
     """
-    # stack()[0] is get_caller_info itself
-    # stack()[1] is the function that called get_caller_info
-    # stack()[2] is the function that called the caller
+    # Only one frame is needed, so take it directly instead of building
+    # inspect.stack() (which reads source lines for every frame)
+    # _getframe(0) is get_caller_info itself
+    # _getframe(1) is the function that called get_caller_info
+    # _getframe(2) is the function that called the caller
+    # sys._getframe is CPython-specific; inspect.currentframe() works elsewhere
+    if hasattr(sys, '_getframe'):
+        frame = sys._getframe(1)
+    else:
+        frame = inspect.currentframe().f_back
+    code = frame.f_code
     
-    caller_frame = inspect.stack()[1]
+    # Source line is read only for this one frame
+    source_line = linecache.getline(code.co_filename, frame.f_lineno).strip()
     
     print(f"\n{'='*70}")
     print("CALLER INFORMATION")
     print(f"{'='*70}")
-    print(f"Called from function: {caller_frame.function}")
-    print(f"File: {caller_frame.filename}")
-    print(f"Line: {caller_frame.lineno}")
-    print(f"Code: {caller_frame.code_context[0].strip() if caller_frame.code_context else 'N/A'}")
+    print(f"Called from function: {code.co_name}")
+    print(f"File: {code.co_filename}")
+    print(f"Line: {frame.f_lineno}")
+    print(f"Code: {source_line or 'N/A'}")
     
     # Access caller's local variables
-    caller_locals = caller_frame.frame.f_locals
+    caller_locals = frame.f_locals
     print(f"\nCaller's local variables:")
     for name, value in caller_locals.items():
         if not name.startswith('_'):
             print(f"  {name} = {value}")
 
-def trace_variable_origins(var_name):
+def trace_variable_origins(var_name, frames=None):
     """
     Trace where a variable was defined in the call stack
+    
+    Pass a list of frames to reuse it instead of walking the stack again
     """
     print(f"\n{'='*70}")
     print(f"TRACING VARIABLE: '{var_name}'")
     print(f"{'='*70}")
     
-    stack = inspect.stack()
+    if frames is None:
+        # sys._getframe is CPython-specific; inspect.currentframe() works elsewhere
+        if hasattr(sys, '_getframe'):
+            frames = _walk_frames(sys._getframe())
+        else:
+            frames = _walk_frames(inspect.currentframe())
     found_in_frames = []
     
-    for i, frame_info in enumerate(stack):
-        local_vars = frame_info.frame.f_locals
+    for i, frame in enumerate(frames):
+        local_vars = frame.f_locals
         if var_name in local_vars:
+            # Location details are only looked up for matching frames
             found_in_frames.append({
                 'frame_num': i,
-                'function': frame_info.function,
-                'file': frame_info.filename,
-                'line': frame_info.lineno,
+                'function': frame.f_code.co_name,
+                'file': frame.f_code.co_filename,
+                'line': frame.f_lineno,
                 'value': local_vars[var_name]
             })
     
@@ -140,16 +182,27 @@ def inner_function(a):
     c = b * 3
     print(f">>> In inner_function: a={a}, b={b}, c={c}")
     
-    # Now show the call stack
-    show_call_stack()
-    
-    # Show caller information
-    get_caller_info()
+    # Walk the stack once and share it - inspect.stack() reads source
+    # lines for every frame, so calling it in each helper repeats that work
+    # (underscore names are skipped when local variables are printed)
+    _stack = inspect.stack()
+    _frames = [frame_info.frame for frame_info in _stack]
     
-    # Trace variable from outer scope
-    trace_variable_origins('x')  # From outer_function
-    trace_variable_origins('z')  # From middle_function
-    trace_variable_origins('c')  # From inner_function
+    try:
+        # Now show the call stack
+        show_call_stack(_stack)
+        
+        # Show caller information
+        get_caller_info()
+        
+        # Trace variable from outer scope
+        trace_variable_origins('x', _frames)  # From outer_function
+        trace_variable_origins('z', _frames)  # From middle_function
+        trace_variable_origins('c', _frames)  # From inner_function
+    finally:
+        # The lists hold this function's own frame, which holds the lists -
+        # a reference cycle. Drop them so the frames are freed right away
+        del _stack, _frames
 
 def advanced_stack_analysis():
     """
@@ -180,32 +233,40 @@ def advanced_stack_analysis():
     print(f"  Locals: {len(frame.f_locals)} items")
     print(f"  Builtins: {len(frame.f_builtins)} items")
 
-def recursive_function(n, depth=0):
+def show_stack_here():
     """
-    Demonstrate stack growth with recursion
+    Show the current stack depth and the chain of function calls
     """
-    if depth == 0:
-        print(f"\n{'='*70}")
-        print("RECURSIVE FUNCTION STACK ANALYSIS")
-        print(f"{'='*70}")
-    
-    print(f"{'  ' * depth}Recursion depth: {depth}, n={n}")
-    
-    if n <= 0:
-        # Base case - show stack
-        stack_depth = len(inspect.stack())
-        print(f"\n{'  ' * depth}Reached base case!")
-        print(f"{'  ' * depth}Total stack depth: {stack_depth} frames")
-        
-        # Show just function names in stack
-        print(f"\n{'  ' * depth}Call chain:")
-        for i, frame in enumerate(inspect.stack()):
-            indent = '  ' * (depth - i)
-            print(f"{indent}{i}. {frame.function}()")
-        
-        return 0
-    else:
-        return recursive_function(n - 1, depth + 1) + n
+    # Walk the stack once and reuse it for both the depth and the call chain
+    stack = inspect.stack()
+    print(f"\nTotal stack depth: {len(stack)} frames")
+    
+    # Show just function names in stack
+    print("\nCall chain:")
+    for i, frame in enumerate(stack):
+        print(f"  {i}. {frame.function}()")
+
+def iterative_sum(n):
+    """
+    Sum n + (n-1) + ... + 1 with a loop instead of recursion
+    
+    A recursive version pushes one new frame per step (and hits RecursionError
+    near depth 1000); the loop stays in a single frame, so the stack shown at
+    the end is the same size whatever n is
+    """
+    print(f"\n{'='*70}")
+    print("ITERATIVE FUNCTION STACK ANALYSIS")
+    print(f"{'='*70}")
+    
+    total = 0
+    for step, k in enumerate(range(n, 0, -1)):
+        print(f"Step: {step}, n={k}")
+        total += k
+    
+    print("\nLoop finished - still a single frame for iterative_sum")
+    show_stack_here()
+    
+    return total
 
 # Demonstration
 print("STACK FRAME INSPECTION DEMONSTRATION")
@@ -217,9 +278,9 @@ outer_function(5)
 print("\n2. Advanced Stack Analysis")
 advanced_stack_analysis()
 
-print("\n3. Recursive Stack Growth")
-result = recursive_function(5)
-print(f"\nRecursive result: {result}")
+print("\n3. Constant Stack Depth with a Loop")
+result = iterative_sum(5)
+print(f"\nIterative result: {result}")
 
 print("\n" + "="*70)
 print("STACK INSPECTION COMPLETE")
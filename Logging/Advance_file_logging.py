@@ -47,46 +47,56 @@ def process_user_data(user_id, data):
     Process user data with comprehensive logging
     
     Demonstrates all logging levels in realistic scenarios
+    
+    Messages use %-style arguments, not f-strings: logging only formats
+    them if the record passes the level check
     """
-    logger.debug(f"Processing started for user {user_id}")
-    logger.debug(f"Input data: {data}")
+    # Check the DEBUG level once - inside the loop each skipped debug call
+    # is then just a branch, not a logger call
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    
+    if debug_enabled:
+        logger.debug("Processing started for user %s", user_id)
+        logger.debug("Input data: %s", data)
     
     # Check if data is empty
     if not data:
-        logger.warning(f"Empty data received for user {user_id}")
-        logger.info(f"Skipping processing for user {user_id} due to empty data")
+        logger.warning("Empty data received for user %s", user_id)
+        logger.info("Skipping processing for user %s due to empty data", user_id)
         return None
     
     # Check data type
     if not isinstance(data, dict):
-        logger.error(f"Invalid data type for user {user_id}: expected dict, got {type(data).__name__}")
+        logger.error("Invalid data type for user %s: expected dict, got %s", user_id, type(data).__name__)
         return None
     
     try:
         # Process data
-        logger.info(f"Processing user {user_id} with {len(data)} fields")
+        logger.info("Processing user %s with %d fields", user_id, len(data))
         
         processed = {}
         for key, value in data.items():
-            logger.debug(f"Processing field '{key}' for user {user_id}")
+            if debug_enabled:
+                logger.debug("Processing field '%s' for user %s", key, user_id)
             
             if not isinstance(value, str):
-                logger.warning(f"Non-string value for field '{key}': {value} ({type(value).__name__})")
+                logger.warning("Non-string value for field '%s': %s (%s)", key, value, type(value).__name__)
                 processed[key] = str(value)  # Convert to string
             else:
                 processed[key] = value.upper()
         
-        logger.info(f"Successfully processed user {user_id}")
-        logger.debug(f"Processed data: {processed}")
+        logger.info("Successfully processed user %s", user_id)
+        if debug_enabled:
+            logger.debug("Processed data: %s", processed)
         return processed
         
     except AttributeError as e:
-        logger.error(f"AttributeError while processing user {user_id}: {e}")
-        logger.debug(f"Problematic data: {data}", exc_info=True)  # Include traceback
+        logger.error("AttributeError while processing user %s: %s", user_id, e)
+        logger.debug("Problematic data: %s", data, exc_info=True)  # Include traceback
         return None
         
     except Exception as e:
-        logger.critical(f"Unexpected critical error for user {user_id}: {e}")
+        logger.critical("Unexpected critical error for user %s: %s", user_id, e)
         logger.debug("Full traceback:", exc_info=True)
         raise
 
@@ -100,7 +110,7 @@ def demonstrate_logging_levels():
     
     # DEBUG level - detailed diagnostic
     logger.debug("Debug: Starting demonstration function")
-    logger.debug(f"Debug: Current time is {datetime.now()}")
+    logger.debug("Debug: Current time is %s", datetime.now())
     
     # INFO level - normal operations
     logger.info("Info: Application running normally")
@@ -24,14 +24,18 @@ class DataValidationError(Exception):
         self.expected_type = expected_type
         self.field_name = field_name
         
+        # The detailed message is built in __str__, only when it's printed -
+        # errors that are caught and inspected field by field never pay for it
+        super().__init__(message)
+    
+    def __str__(self):
         # Create detailed error message
-        full_message = f"{message}\n"
-        if field_name:
-            full_message += f"Field: {field_name}\n"
-        full_message += f"Expected: {expected_type.__name__}\n"
-        full_message += f"Received: {type(data).__name__} = {data}"
-        
-        super().__init__(full_message)
+        full_message = f"{self.message}\n"
+        if self.field_name:
+            full_message += f"Field: {self.field_name}\n"
+        full_message += f"Expected: {self.expected_type.__name__}\n"
+        full_message += f"Received: {type(self.data).__name__} = {self.data}"
+        return full_message
 
 class ProcessingError(Exception):
     """Exception for processing failures"""
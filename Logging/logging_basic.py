@@ -16,12 +16,30 @@ CRITICAL - Very serious, program may crash
 
 import logging
 
+# NumPy is optional - without it every input takes the list path
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # Configure logging (do this once at program start)
 logging.basicConfig(
     level=logging.DEBUG,  # Show all messages at DEBUG level and above
     format='%(levelname)s: %(message)s'  # Format: LEVEL: message
 )
 
+def double_values(data):
+    """
+    Multiply every item by 2
+    
+    NumPy arrays are doubled with one vectorized multiply (no Python loop);
+    lists use a list comprehension - converting a list to an array and
+    back costs more than the loop itself
+    """
+    if np is not None and isinstance(data, np.ndarray):
+        return data * 2
+    return [x * 2 for x in data]
+
 def process_data(data):
     """Process data with comprehensive logging"""
     
@@ -33,7 +51,7 @@ def process_data(data):
     logging.info("Processing in progress")
     
     # Perform the actual processing
-    result = [x * 2 for x in data]
+    result = double_values(data)
     
     # DEBUG: Show the result for verification
     logging.debug(f"Result: {result}")
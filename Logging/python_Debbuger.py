@@ -8,7 +8,7 @@ CONCEPT: Python Debugger (pdb)
 
 HOW TO USE:
 1. Run the program
-2. When pdb.set_trace() is hit, execution pauses
+2. When breakpoint() is hit, execution pauses
 3. Use commands to navigate and inspect
 4. Type 'help' in debugger for command list
 
@@ -20,9 +20,10 @@ p var        - Print variable value
 l (list)     - Show code context
 w (where)    - Show call stack
 q (quit)     - Exit debugger
-"""
 
-import pdb
+breakpoint() (Python 3.7+) starts pdb without importing it up front.
+Run with PYTHONBREAKPOINT=0 to turn every breakpoint() into a no-op
+"""
 
 def complex_calculation(x, y, z):
     """
@@ -39,7 +40,7 @@ def complex_calculation(x, y, z):
     print(f"Starting calculation with x={x}, y={y}, z={z}")
     
     # Breakpoint - execution will pause here
-    pdb.set_trace()  # <-- Debugger will stop at this line
+    breakpoint()  # <-- Debugger will stop at this line
     
     step1 = x + y
     print(f"Step 1: {x} + {y} = {step1}")
@@ -65,7 +66,7 @@ def debug_loop_example():
     for i, num in enumerate(numbers):
         # Conditional breakpoint - only pause when num is 3
         if num == 3:
-            pdb.set_trace()  # Will only pause when num == 3
+            breakpoint()  # Will only pause when num == 3
         
         squared = num ** 2
         results.append(squared)
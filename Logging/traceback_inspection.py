@@ -14,6 +14,17 @@ Traceback Components:
 
 import traceback
 import sys
+from functools import lru_cache
+
+@lru_cache(maxsize=128)
+def _fmt_frame(filename, lineno, name):
+    """
+    Location lines for one frame
+    
+    An error raised again from the same line gets the same arguments,
+    so the string is built once and then reused
+    """
+    return "  Function: %s\n  File: %s\n  Line: %d" % (name, filename, lineno)
 
 def level_3_deepest():
     """Innermost function where error occurs"""
@@ -47,9 +58,13 @@ def demonstrate_traceback():
         result = level_1_outer(5)
         
     except Exception as e:
+        # Look up the name and message once and reuse them below
+        exc_name = type(e).__name__
+        exc_message = str(e)
+        
         print("\n--- BASIC EXCEPTION INFO ---")
-        print(f"Exception Type: {type(e).__name__}")
-        print(f"Exception Message: {str(e)}")
+        print(f"Exception Type: {exc_name}")
+        print(f"Exception Message: {exc_message}")
         
         print("\n--- EXCEPTION DETAILS (sys.exc_info) ---")
         exc_type, exc_value, exc_traceback = sys.exc_info()
@@ -57,31 +72,32 @@ def demonstrate_traceback():
         print(f"Value: {exc_value}")
         print(f"Traceback object: {exc_traceback}")
         
+        # Extract the frames once - print_exc(), format_tb() and
+        # format_exception() would each walk the traceback and read the
+        # source lines again
+        tb_exc = traceback.TracebackException(exc_type, exc_value, exc_traceback)
+        formatted = ''.join(tb_exc.format())
+        
         print("\n--- FORMATTED TRACEBACK ---")
-        traceback.print_exc()
+        # Same output as print_exc(): the full traceback, on stderr
+        print(formatted, file=sys.stderr, end="")
         
         print("\n--- DETAILED TRACEBACK ANALYSIS ---")
-        tb_lines = traceback.format_tb(exc_traceback)
+        tb_lines = tb_exc.stack.format()
         for i, line in enumerate(tb_lines, 1):
             print(f"Frame {i}:")
             print(line)
         
         print("\n--- TRACEBACK FRAME DETAILS ---")
-        tb = exc_traceback
-        frame_number = 1
-        while tb is not None:
-            frame = tb.tb_frame
+        # walk_tb() yields each frame with its line number; no source is read
+        for frame_number, (frame, lineno) in enumerate(traceback.walk_tb(exc_traceback), 1):
+            code = frame.f_code
             print(f"\nFrame {frame_number}:")
-            print(f"  Function: {frame.f_code.co_name}")
-            print(f"  File: {frame.f_code.co_filename}")
-            print(f"  Line: {tb.tb_lineno}")
+            print(_fmt_frame(code.co_filename, lineno, code.co_name))
             print(f"  Local variables: {frame.f_locals}")
-            
-            tb = tb.tb_next
-            frame_number += 1
         
         print("\n--- FORMATTED EXCEPTION STRING ---")
-        exception_str = ''.join(traceback.format_exception(exc_type, exc_value, exc_traceback))
+        exception_str = formatted
         print(exception_str)
 
 # Run the demonstration
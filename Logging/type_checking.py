@@ -14,26 +14,33 @@ def add_items(item1, item2):
     """
     Add two items with comprehensive type checking and debugging
     """
-    # Debug: Show what we received
-    print(f"Type of item1: {type(item1).__name__}, Value: {item1}")
-    print(f"Type of item2: {type(item2).__name__}, Value: {item2}")
+    type1 = type(item1)
+    type2 = type(item2)
+    
+    # Debug: Show what we received (python -O removes this block)
+    if __debug__:
+        print(f"Type of item1: {type1.__name__}, Value: {item1}")
+        print(f"Type of item2: {type2.__name__}, Value: {item2}")
     
     # Check if both items are numbers
-    if not isinstance(item1, (int, float)):
+    # Exact int/float (the usual case) is an identity check; isinstance()
+    # is only needed for subclasses such as bool
+    if type1 is not int and type1 is not float and not isinstance(item1, (int, float)):
         raise TypeError(
             f"First item must be a number (int or float), "
-            f"but got {type(item1).__name__}: {item1}"
+            f"but got {type1.__name__}: {item1}"
         )
     
-    if not isinstance(item2, (int, float)):
+    if type2 is not int and type2 is not float and not isinstance(item2, (int, float)):
         raise TypeError(
             f"Second item must be a number (int or float), "
-            f"but got {type(item2).__name__}: {item2}"
+            f"but got {type2.__name__}: {item2}"
         )
     
     # If we reach here, types are valid
     result = item1 + item2
-    print(f"Result type: {type(result).__name__}, Value: {result}")
+    if __debug__:
+        print(f"Result type: {type(result).__name__}, Value: {result}")
     
     return result
 
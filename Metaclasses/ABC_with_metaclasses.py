@@ -3,39 +3,41 @@ CONCEPT: Custom ABC implementation
 LEARN: Enforce method implementation using metaclass
 """
 
+_NO_ABSTRACT_METHODS = frozenset()
+
 class ABCMeta(type):
     """Custom Abstract Base Class metaclass"""
     
     def __new__(cls, name, bases, attrs):
         # Collect abstract methods from base classes
-        abstract_methods = set()
+        # (one getattr with a default instead of hasattr() then getattr())
+        inherited = set()
         for base in bases:
-            if hasattr(base, '_abstract_methods'):
-                abstract_methods.update(base._abstract_methods)
+            inherited.update(getattr(base, '_abstract_methods', ()))
         
         # Find new abstract methods in current class
-        for attr_name, attr_value in attrs.items():
-            if getattr(attr_value, '_is_abstract', False):
-                abstract_methods.add(attr_name)
+        abstract_methods = {
+            attr_name for attr_name, attr_value in attrs.items()
+            if getattr(attr_value, '_is_abstract', False)
+        }
+        
+        # Keep inherited ones this class doesn't implement - any name defined
+        # here is either abstract (already counted) or an implementation
+        abstract_methods.update(inherited.difference(attrs))
         
-        # Remove implemented methods
-        for attr_name in attrs:
-            if attr_name in abstract_methods:
-                if not getattr(attrs[attr_name], '_is_abstract', False):
-                    abstract_methods.discard(attr_name)
+        # Concrete classes share one empty frozenset
+        abstract_methods = frozenset(abstract_methods) if abstract_methods else _NO_ABSTRACT_METHODS
         
         new_class = super().__new__(cls, name, bases, attrs)
         new_class._abstract_methods = abstract_methods
         
+        # The check itself is the one abc.ABCMeta relies on: setting
+        # __abstractmethods__ marks the type, and object.__new__ (C code)
+        # refuses to build instances of a marked type. An empty set clears
+        # the mark, so concrete classes are created with no extra Python call
+        new_class.__abstractmethods__ = abstract_methods
+        
         return new_class
-    
-    def __call__(cls, *args, **kwargs):
-        if cls._abstract_methods:
-            raise TypeError(
-                f"Can't instantiate abstract class {cls.__name__} "
-                f"with abstract methods: {', '.join(cls._abstract_methods)}"
-            )
-        return super(ABCMeta, cls).__call__(*args, **kwargs)
 
 def abstractmethod(func):
     """Decorator to mark methods as abstract"""
@@ -43,6 +45,9 @@ def abstractmethod(func):
     return func
 
 class Shape(metaclass=ABCMeta):
+    # Empty slots here so subclasses that declare __slots__ get no __dict__
+    __slots__ = ()
+    
     @abstractmethod
     def area(self):
         pass
@@ -55,16 +60,21 @@ class Shape(metaclass=ABCMeta):
         return f"A shape with area {self.area()}"
 
 class Circle(Shape):
+    __slots__ = ('radius',)
+    
     def __init__(self, radius):
         self.radius = radius
     
     def area(self):
-        return 3.14159 * self.radius ** 2
+        # r * r is a single multiply; ** goes through the generic power code
+        return self.radius * self.radius * 3.14159
     
     def perimeter(self):
         return 2 * 3.14159 * self.radius
 
 class Rectangle(Shape):
+    __slots__ = ('width', 'height')
+    
     def __init__(self, width, height):
         self.width = width
         self.height = height
@@ -5,6 +5,8 @@ LEARN: Building framework-like features with metaclass
 
 class Endpoint:
     """Descriptor for API endpoints"""
+    __slots__ = ('method', 'path', 'handler')
+    
     def __init__(self, method, path, handler):
         self.method = method
         self.path = path
@@ -29,29 +31,34 @@ class APIMeta(type):
         
         # Find all route handlers
         for attr_name, attr_value in attrs.items():
-            if hasattr(attr_value, '_route_method') and hasattr(attr_value, '_route_path'):
-                method = attr_value._route_method
+            # One getattr with a default instead of hasattr() checks followed
+            # by a second lookup of the same attribute
+            method = getattr(attr_value, '_route_method', None)
+            if method is not None:
                 path = attr_value._route_path
-                route_key = f"{method}:{path}"
-                routes[route_key] = attr_name
+                routes[(method, path)] = attr_name
         
-        attrs['_routes'] = routes
+        # Frozen route table: ((method, path), handler_name) pairs
+        attrs['_routes'] = tuple(routes.items())
         
-        # Add dispatch method
-        def dispatch(self, method, path, **params):
-            route_key = f"{method}:{path}"
-            if route_key in self._routes:
-                handler_name = self._routes[route_key]
-                handler = getattr(self, handler_name)
-                return handler(**params)
-            else:
-                return {"error": "Route not found", "code": 404}
+        # Add dispatch method - generated once per class as source code, with
+        # one "if" per route, so a request becomes a couple of string
+        # comparisons and a direct method call (no key building or getattr)
+        lines = ["def dispatch(self, method, path, **params):"]
+        for (method, path), handler_name in routes.items():
+            lines.append(
+                f"    if method == {method!r} and path == {path!r}: "
+                f"return self.{handler_name}(**params)"
+            )
+        lines.append('    return {"error": "Route not found", "code": 404}')
         
-        attrs['dispatch'] = dispatch
+        namespace = {}
+        exec(compile("\n".join(lines), f"<APIMeta {name}>", "exec"), namespace)
+        attrs['dispatch'] = namespace['dispatch']
         
         # Add list_routes method
         def list_routes(cls):
-            return list(cls._routes.keys())
+            return [f"{method}:{path}" for (method, path), _ in cls._routes]
         
         attrs['list_routes'] = classmethod(list_routes)
         
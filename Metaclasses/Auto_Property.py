@@ -3,6 +3,8 @@ CONCEPT: Automatic property creation
 LEARN: Transform attributes into properties automatically
 """
 
+import operator
+
 class AutoPropertyMeta(type):
     """Metaclass that converts _private attributes to properties"""
     
@@ -12,30 +14,43 @@ class AutoPropertyMeta(type):
         for attr_name, attr_value in attrs.items():
             new_attrs[attr_name] = attr_value
             
-            # Convert _private attributes to properties
-            if attr_name.startswith('_') and not attr_name.startswith('__'):
+            # Convert _private class attributes to properties
+            # (index/slice tests - no startswith() method calls)
+            if attr_name[0] == '_' and attr_name[1:2] != '_':
                 prop_name = attr_name[1:]  # Remove leading underscore
                 
-                # Create getter
-                def make_getter(attr):
-                    def getter(self):
-                        return getattr(self, attr)
-                    return getter
-                
                 # Create setter
                 def make_setter(attr):
                     def setter(self, value):
                         setattr(self, attr, value)
                     return setter
                 
+                # attrgetter is written in C - no Python frame per read
                 new_attrs[prop_name] = property(
-                    make_getter(attr_name),
+                    operator.attrgetter(attr_name),
                     make_setter(attr_name)
                 )
         
-        return super().__new__(cls, name, bases, new_attrs)
+        new_class = super().__new__(cls, name, bases, new_attrs)
+        
+        # Convert _private slots to properties too. Slot values live at a fixed
+        # offset in the instance (no __dict__), and the slot descriptor's own
+        # __get__/__set__ (C code) serve directly as the getter and setter
+        slots = attrs.get('__slots__', ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for slot_name in slots:
+            if slot_name[0] == '_' and slot_name[1:2] != '_':
+                slot = new_class.__dict__[slot_name]
+                setattr(new_class, slot_name[1:], property(slot.__get__, slot.__set__))
+        
+        return new_class
 
 class Person(metaclass=AutoPropertyMeta):
+    # Attributes set in __init__ are not in the class body, so list them
+    # as slots for the metaclass to find
+    __slots__ = ('_name', '_age', '_email')
+    
     def __init__(self, name, age):
         self._name = name
         self._age = age
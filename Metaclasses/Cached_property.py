@@ -3,8 +3,28 @@ CONCEPT: Automatic caching for expensive properties
 LEARN: Performance optimization with metaclass
 """
 
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Sleep in each property to imitate an expensive computation - set to
+# False to time the real work on its own
+DEBUG_SIMULATE_SLOW = True
+
 class CachedProperty:
-    """Descriptor for cached properties"""
+    """
+    Descriptor for cached properties
+    
+    Non-data descriptor (no __set__): the first access computes the value and
+    stores it in the instance __dict__ under the same name. Instance
+    attributes win over non-data descriptors, so later accesses read the
+    dict directly and never call __get__ again
+    """
+    __slots__ = ('func', 'name')
+    
     def __init__(self, func):
         self.func = func
         self.name = func.__name__
@@ -13,20 +33,11 @@ class CachedProperty:
         if instance is None:
             return self
         
-        # Check if value is cached
-        cache_attr = f'_cached_{self.name}'
-        if not hasattr(instance, cache_attr):
-            # Compute and cache the value
-            value = self.func(instance)
-            setattr(instance, cache_attr, value)
-            print(f"Computed and cached: {self.name}")
-        else:
-            print(f"Retrieved from cache: {self.name}")
-        
-        return getattr(instance, cache_attr)
-    
-    def __set__(self, instance, value):
-        raise AttributeError("Can't set cached property")
+        # Compute and cache the value
+        value = self.func(instance)
+        instance.__dict__[self.name] = value
+        print(f"Computed and cached: {self.name}")
+        return value
 
 class CachingMeta(type):
     """Metaclass that converts properties to cached properties"""
@@ -46,27 +57,30 @@ class CachingMeta(type):
 class DataProcessor(metaclass=CachingMeta):
     def __init__(self, data):
         self.data = data
+        # NumPy arrays are reduced with their own C methods; everything
+        # else (lists, tuples) uses the builtins
+        self._is_array = np is not None and isinstance(data, np.ndarray)
     
     @property
     def total(self):
         print("  -> Computing total...")
-        import time
-        time.sleep(1)  # Simulate expensive operation
-        return sum(self.data)
+        if DEBUG_SIMULATE_SLOW:
+            time.sleep(1)  # Simulate expensive operation
+        return self.data.sum() if self._is_array else sum(self.data)
     
     @property
     def average(self):
         print("  -> Computing average...")
-        import time
-        time.sleep(1)
-        return sum(self.data) / len(self.data)
+        if DEBUG_SIMULATE_SLOW:
+            time.sleep(1)
+        return self.data.mean() if self._is_array else sum(self.data) / len(self.data)
     
     @property
     def max_value(self):
         print("  -> Computing max...")
-        import time
-        time.sleep(1)
-        return max(self.data)
+        if DEBUG_SIMULATE_SLOW:
+            time.sleep(1)
+        return self.data.max() if self._is_array else max(self.data)
 
 if __name__ == "__main__":
     processor = DataProcessor([1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
@@ -74,6 +88,7 @@ if __name__ == "__main__":
     print("First access to total:")
     print(f"Total: {processor.total}")
     
+    # Served from processor.__dict__ - CachedProperty.__get__ isn't called
     print("\nSecond access to total:")
     print(f"Total: {processor.total}")
     
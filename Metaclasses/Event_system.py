@@ -11,23 +11,27 @@ class EventMeta(type):
         event_handlers = {}
         
         for attr_name, attr_value in attrs.items():
-            if hasattr(attr_value, '_event_name'):
-                event_name = attr_value._event_name
+            # One getattr with a default instead of hasattr() followed by a
+            # second lookup of the same attribute
+            event_name = getattr(attr_value, '_event_name', None)
+            if event_name is not None:
                 if event_name not in event_handlers:
                     event_handlers[event_name] = []
                 event_handlers[event_name].append(attr_name)
         
         attrs['_event_handlers'] = event_handlers
         
+        # The handler functions themselves, looked up once per class - emit
+        # passes self to them instead of doing a getattr per handler
+        attrs['_handler_funcs'] = {
+            event: tuple(attrs[handler_name] for handler_name in handler_names)
+            for event, handler_names in event_handlers.items()
+        }
+        
         # Add emit method
         def emit(self, event_name, *args, **kwargs):
-            handlers = self._event_handlers.get(event_name, [])
-            results = []
-            for handler_name in handlers:
-                handler = getattr(self, handler_name)
-                result = handler(*args, **kwargs)
-                results.append(result)
-            return results
+            return [handler(self, *args, **kwargs)
+                    for handler in self._handler_funcs.get(event_name, ())]
         
         attrs['emit'] = emit
         
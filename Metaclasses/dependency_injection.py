@@ -3,39 +3,77 @@ CONCEPT: Automatic dependency injection container
 LEARN: IoC (Inversion of Control) pattern with metaclass
 """
 
-import inspect
+import functools
 from typing import get_type_hints
 
+def _annotated_params(func):
+    """
+    Map each annotated parameter of func to its type
+    
+    Reads func.__annotations__ (a plain dict) instead of building an
+    inspect.signature() with its Signature/Parameter objects
+    """
+    annotations = getattr(func, '__annotations__', {})
+    return {name: annotation for name, annotation in annotations.items() if name != 'return'}
+
+def _defaulted_params(func):
+    """Names of func's parameters that have a default value"""
+    # InjectableMeta's __init__ wrapper takes **kwargs; look at the original
+    func = getattr(func, '__wrapped__', func)
+    code = getattr(func, '__code__', None)
+    if code is None:
+        return frozenset()
+    defaults = func.__defaults__ or ()
+    positional = code.co_varnames[code.co_argcount - len(defaults):code.co_argcount]
+    return frozenset(positional).union(func.__kwdefaults__ or ())
+
 class DependencyContainer:
     """Container for managing dependencies"""
     def __init__(self):
         self._services = {}
         self._singletons = {}
+        self._factories = {}
     
     def register(self, service_type, implementation=None, singleton=False):
         """Register a service"""
         if implementation is None:
             implementation = service_type
         
+        # Dependencies are worked out here, once - resolve() only looks them up
         self._services[service_type] = {
             'implementation': implementation,
-            'singleton': singleton
+            'singleton': singleton,
+            'deps': _annotated_params(implementation.__init__),
+            'defaulted': _defaulted_params(implementation.__init__)
         }
+        
+        # A new registration can change what other services get injected,
+        # so factories are rebuilt on their next resolve()
+        self._factories.clear()
+        # Forget any instance made from an earlier registration
+        self._singletons.pop(service_type, None)
     
     def resolve(self, service_type):
         """Resolve a service instance"""
-        if service_type not in self._services:
-            raise ValueError(f"Service {service_type.__name__} not registered")
+        # Return singleton if exists - checked first, since after startup
+        # most lookups are singletons that already exist (one dict lookup)
+        instance = self._singletons.get(service_type)
+        if instance is not None:
+            return instance
         
-        service_info = self._services[service_type]
+        service_info = self._services.get(service_type)
+        if service_info is None:
+            raise ValueError(f"Service {service_type.__name__} not registered")
         implementation = service_info['implementation']
         
-        # Return singleton if exists
-        if service_info['singleton'] and service_type in self._singletons:
-            return self._singletons[service_type]
-        
         # Create instance with dependency injection
-        instance = self._create_instance(implementation)
+        factory = self._factories.get(service_type)
+        if factory is None:
+            factory = self._make_factory(
+                implementation, service_info['deps'], service_info['defaulted']
+            )
+            self._factories[service_type] = factory
+        instance = factory(self.resolve)
         
         # Store singleton
         if service_info['singleton']:
@@ -43,21 +81,27 @@ class DependencyContainer:
         
         return instance
     
-    def _create_instance(self, cls):
-        """Create instance with automatic dependency injection"""
-        sig = inspect.signature(cls.__init__)
-        dependencies = {}
+    def _make_factory(self, cls, deps, defaulted):
+        """
+        Generate a function that creates cls with its dependencies injected
         
-        for param_name, param in sig.parameters.items():
-            if param_name == 'self':
-                continue
-            
-            # Get type annotation
-            if param.annotation != inspect.Parameter.empty:
-                param_type = param.annotation
-                dependencies[param_name] = self.resolve(param_type)
+        For UserService the generated source is:
+            def factory(resolve):
+                return cls(repository=resolve(dep_0), email_service=resolve(dep_1))
+        A straight-line call - no dict of kwargs to build on every resolve
+        """
+        # Unregistered dependencies with a default are left to that default;
+        # a required one is still resolved, which raises "not registered"
+        namespace = {'cls': cls}
+        arguments = []
+        for i, (param_name, param_type) in enumerate(deps.items()):
+            if param_type in self._services or param_name not in defaulted:
+                namespace[f'dep_{i}'] = param_type
+                arguments.append(f"{param_name}=resolve(dep_{i})")
         
-        return cls(**dependencies)
+        source = f"def factory(resolve):\n    return cls({', '.join(arguments)})\n"
+        exec(compile(source, f"<factory {cls.__name__}>", "exec"), namespace)
+        return namespace['factory']
 
 class InjectableMeta(type):
     """Metaclass for dependency injection"""
@@ -71,20 +115,20 @@ class InjectableMeta(type):
         original_init = attrs.get('__init__')
         
         # Create new __init__ with dependency injection
-        def new_init(self, **kwargs):
-            # Get type hints for dependencies
-            if original_init:
-                sig = inspect.signature(original_init)
+        if original_init:
+            # Get type hints for dependencies - once, when the class is created
+            dependencies = _annotated_params(original_init)
+            
+            # wraps() keeps the original annotations visible on the new __init__
+            @functools.wraps(original_init)
+            def new_init(self, **kwargs):
                 injected_kwargs = {}
                 
-                for param_name, param in sig.parameters.items():
-                    if param_name == 'self':
-                        continue
-                    
+                for param_name, param_type in dependencies.items():
                     # If not provided and has type annotation, inject it
-                    if param_name not in kwargs and param.annotation != inspect.Parameter.empty:
+                    if param_name not in kwargs:
                         try:
-                            injected_kwargs[param_name] = cls._container.resolve(param.annotation)
+                            injected_kwargs[param_name] = cls._container.resolve(param_type)
                         except ValueError:
                             # Not registered, skip
                             pass
@@ -92,8 +136,7 @@ class InjectableMeta(type):
                 # Merge provided and injected kwargs
                 final_kwargs = {**injected_kwargs, **kwargs}
                 original_init(self, **final_kwargs)
-        
-        if original_init:
+            
             attrs['__init__'] = new_init
         
         new_class = super().__new__(cls, name, bases, attrs)
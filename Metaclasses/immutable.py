@@ -9,15 +9,31 @@ class ImmutableMeta(type):
     def __call__(cls, *args, **kwargs):
         instance = super().__call__(*args, **kwargs)
         
-        # Freeze the instance
-        instance._frozen = True
+        # Freeze the instance (object.__setattr__ skips our own check)
+        if isinstance(instance, cls):
+            object.__setattr__(instance, '_frozen', True)
         
         return instance
     
     def __new__(cls, name, bases, attrs):
+        # Fields declared as annotations (x: int) become __slots__: values
+        # are stored in a fixed array in the instance instead of a __dict__,
+        # which makes each instance several times smaller
+        # Fields with a class-level default can't be slots, so a class
+        # that has any keeps the normal __dict__
+        fields = attrs.get('__annotations__', {})
+        if fields and '__slots__' not in attrs and not any(f in attrs for f in fields):
+            slots = tuple(fields)
+            # The frozen flag needs a slot too, unless a base already has one
+            if not any(isinstance(base, ImmutableMeta) for base in bases):
+                slots += ('_frozen',)
+            attrs['__slots__'] = slots
+        
         # Override __setattr__ to prevent modifications
+        # _frozen is unset until __call__ freezes the instance - also while
+        # copy/pickle rebuild one through cls.__new__ - so read it with a default
         def __setattr__(self, key, value):
-            if hasattr(self, '_frozen') and self._frozen:
+            if getattr(self, '_frozen', False):
                 raise AttributeError(
                     f"Cannot modify immutable instance of {self.__class__.__name__}"
                 )
@@ -25,18 +41,35 @@ class ImmutableMeta(type):
         
         # Override __delattr__ to prevent deletions
         def __delattr__(self, key):
-            if hasattr(self, '_frozen') and self._frozen:
+            if getattr(self, '_frozen', False):
                 raise AttributeError(
                     f"Cannot delete attributes from immutable instance"
                 )
             object.__delattr__(self, key)
         
+        # copy and pickle restore the saved attributes (the frozen flag
+        # included) through this, so it must not go through __setattr__.
+        # state is the __dict__ contents, or (dict, slot values) for slots
+        def __setstate__(self, state):
+            if isinstance(state, tuple):
+                dict_state, slot_state = state
+            else:
+                dict_state, slot_state = state, None
+            for part in (dict_state, slot_state):
+                if part:
+                    for key, value in part.items():
+                        object.__setattr__(self, key, value)
+        
         attrs['__setattr__'] = __setattr__
         attrs['__delattr__'] = __delattr__
+        attrs.setdefault('__setstate__', __setstate__)
         
         return super().__new__(cls, name, bases, attrs)
 
 class Point(metaclass=ImmutableMeta):
+    x: float
+    y: float
+    
     def __init__(self, x, y):
         self.x = x
         self.y = y
@@ -48,6 +81,9 @@ class Point(metaclass=ImmutableMeta):
         return (self.x ** 2 + self.y ** 2) ** 0.5
 
 class Person(metaclass=ImmutableMeta):
+    name: str
+    age: int
+    
     def __init__(self, name, age):
         self.name = name
         self.age = age
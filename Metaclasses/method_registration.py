@@ -14,14 +14,21 @@ class RegistryMeta(type):
             'magic_methods': []
         }
         
+        # Bind each list's append once instead of looking it up per method
+        add_public = registry['public_methods'].append
+        add_private = registry['private_methods'].append
+        add_magic = registry['magic_methods'].append
+        
         for attr_name, attr_value in attrs.items():
-            if callable(attr_value):
-                if attr_name.startswith('__') and attr_name.endswith('__'):
-                    registry['magic_methods'].append(attr_name)
-                elif attr_name.startswith('_'):
-                    registry['private_methods'].append(attr_name)
-                else:
-                    registry['public_methods'].append(attr_name)
+            if not callable(attr_value):
+                continue
+            # Slice comparisons instead of startswith()/endswith() calls
+            if attr_name[:2] == '__' and attr_name[-2:] == '__':
+                add_magic(attr_name)
+            elif attr_name[:1] == '_':
+                add_private(attr_name)
+            else:
+                add_public(attr_name)
         
         attrs['_method_registry'] = registry
         
@@ -5,6 +5,9 @@ LEARN: Database-like field validation using metaclass
 
 class Field:
     """Base field descriptor"""
+    # Fixed attributes - __get__/__set__ read them on every field access
+    __slots__ = ('field_type', 'required', 'default', 'name')
+    
     def __init__(self, field_type, required=True, default=None):
         self.field_type = field_type
         self.required = required
@@ -20,12 +23,16 @@ class Field:
         return instance.__dict__.get(self.name, self.default)
     
     def __set__(self, instance, value):
-        if value is None and self.required:
-            raise ValueError(f"{self.name} is required")
-        if value is not None and not isinstance(value, self.field_type):
-            raise TypeError(
-                f"{self.name} must be {self.field_type.__name__}, got {type(value).__name__}"
-            )
+        # A value of exactly field_type (the usual case) passes with one
+        # identity check; None and subclasses go through the full checks
+        if type(value) is not self.field_type:
+            if value is None:
+                if self.required:
+                    raise ValueError(f"{self.name} is required")
+            elif not isinstance(value, self.field_type):
+                raise TypeError(
+                    f"{self.name} must be {self.field_type.__name__}, got {type(value).__name__}"
+                )
         instance.__dict__[self.name] = value
 
 class ModelMeta(type):
@@ -40,23 +47,31 @@ class ModelMeta(type):
         
         attrs['_fields'] = fields
         
-        # Add validation method
-        def validate(self):
-            for field_name, field in self._fields.items():
-                value = getattr(self, field_name)
-                if value is None and field.required:
-                    raise ValueError(f"Field {field_name} is required")
+        # validate() and to_dict() are generated as source code for this
+        # model's fields, one line per field - no loop over _fields and no
+        # getattr() by name when they are called. For User:
+        #   def to_dict(self):
+        #       return {'name': self.name, 'age': self.age, ...}
         
-        attrs['validate'] = validate
+        # Add validation method
+        validate_lines = ["def validate(self):"]
+        for field_name, field in fields.items():
+            if field.required:
+                validate_lines.append(f"    if self.{field_name} is None:")
+                validate_lines.append(
+                    f"        raise ValueError({f'Field {field_name} is required'!r})"
+                )
+        validate_lines.append("    return None")
         
         # Add to_dict method
-        def to_dict(self):
-            return {
-                field_name: getattr(self, field_name)
-                for field_name in self._fields.keys()
-            }
+        items = ", ".join(f"{field_name!r}: self.{field_name}" for field_name in fields)
+        to_dict_lines = ["def to_dict(self):", f"    return {{{items}}}"]
         
-        attrs['to_dict'] = to_dict
+        namespace = {}
+        source = "\n".join(validate_lines + to_dict_lines) + "\n"
+        exec(compile(source, f"<ModelMeta {name}>", "exec"), namespace)
+        attrs['validate'] = namespace['validate']
+        attrs['to_dict'] = namespace['to_dict']
         
         return super().__new__(cls, name, bases, attrs)
 
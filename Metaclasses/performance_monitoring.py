@@ -5,26 +5,62 @@ LEARN: Method execution time monitoring and statistics
 
 import time
 import functools
-from collections import defaultdict
+import math
+from types import FunctionType
+from collections import deque
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Only the most recent durations are kept per method, so a long-running
+# program doesn't grow call_history forever
+CALL_HISTORY_SIZE = 1000
 
 class PerformanceStats:
-    """Store performance statistics for methods"""
+    """
+    Store performance statistics for methods
+    
+    Durations are kept as integer nanoseconds (from perf_counter_ns) and
+    only converted to seconds when read through the *_time properties
+    """
+    __slots__ = ('call_count', 'total_ns', 'min_ns', 'max_ns', 'call_history')
+    
     def __init__(self):
+        self.reset()
+    
+    def reset(self):
         self.call_count = 0
-        self.total_time = 0
-        self.min_time = float('inf')
-        self.max_time = 0
-        self.call_history = []
+        self.total_ns = 0
+        self.min_ns = float('inf')
+        self.max_ns = 0
+        self.call_history = deque(maxlen=CALL_HISTORY_SIZE)
     
-    def add_call(self, duration):
+    def add_call(self, duration_ns):
         self.call_count += 1
-        self.total_time += duration
-        self.min_time = min(self.min_time, duration)
-        self.max_time = max(self.max_time, duration)
-        self.call_history.append(duration)
+        self.total_ns += duration_ns
+        # Plain comparisons - min()/max() would be two builtin calls per call
+        if duration_ns < self.min_ns:
+            self.min_ns = duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+        self.call_history.append(duration_ns)
+    
+    @property
+    def total_time(self):
+        return self.total_ns / 1e9
+    
+    @property
+    def min_time(self):
+        return self.min_ns / 1e9
+    
+    @property
+    def max_time(self):
+        return self.max_ns / 1e9
     
     def average_time(self):
-        return self.total_time / self.call_count if self.call_count > 0 else 0
+        return self.total_ns / self.call_count / 1e9 if self.call_count > 0 else 0
     
     def __repr__(self):
         return (f"PerformanceStats(calls={self.call_count}, "
@@ -37,11 +73,14 @@ class PerformanceMonitorMeta(type):
     
     def __new__(cls, name, bases, attrs):
         # Create performance tracking dictionary
-        performance_data = defaultdict(PerformanceStats)
+        # (method name -> PerformanceStats, filled in by _wrap_method)
+        performance_data = {}
         
-        # Wrap all callable methods
+        # Wrap all public methods - plain functions only: a staticmethod is
+        # callable too, but wrapping it in a function would turn it into an
+        # instance method (classmethod/property objects are left alone as well)
         for attr_name, attr_value in list(attrs.items()):
-            if callable(attr_value) and not attr_name.startswith('_'):
+            if isinstance(attr_value, FunctionType) and attr_name[0] != '_':
                 attrs[attr_name] = cls._wrap_method(attr_value, attr_name, performance_data)
         
         attrs['_performance_data'] = performance_data
@@ -54,6 +93,8 @@ class PerformanceMonitorMeta(type):
             report += f"{'='*60}\n"
             
             for method_name, stats in sorted(self._performance_data.items()):
+                if not stats.call_count:
+                    continue  # Never called
                 report += f"\n{method_name}:\n"
                 report += f"  Calls: {stats.call_count}\n"
                 report += f"  Total Time: {stats.total_time:.4f}s\n"
@@ -65,11 +106,14 @@ class PerformanceMonitorMeta(type):
         
         def reset_performance_stats(self):
             """Reset all performance statistics"""
-            self._performance_data.clear()
+            # Reset in place - each wrapper holds on to its stats object
+            for stats in self._performance_data.values():
+                stats.reset()
         
         def get_method_stats(self, method_name):
             """Get stats for a specific method"""
-            return self._performance_data.get(method_name)
+            stats = self._performance_data.get(method_name)
+            return stats if stats is not None and stats.call_count else None
         
         attrs['get_performance_report'] = get_performance_report
         attrs['reset_performance_stats'] = reset_performance_stats
@@ -80,15 +124,24 @@ class PerformanceMonitorMeta(type):
     @staticmethod
     def _wrap_method(method, method_name, performance_data):
         """Wrap a method to track its performance"""
+        # perf_counter_ns: monotonic (not affected by clock changes) and an
+        # int, so no float is created per reading. Bound to a local here so
+        # the wrapper doesn't look up time.perf_counter_ns on every call
+        clock = time.perf_counter_ns
+        
+        # Method names are fixed when the class is created, so the stats
+        # object is looked up once here - not in the dict on every call
+        stats = performance_data[method_name] = PerformanceStats()
+        add_call = stats.add_call
+        
         @functools.wraps(method)
         def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_time = clock()
             try:
                 result = method(*args, **kwargs)
                 return result
             finally:
-                duration = time.time() - start_time
-                performance_data[method_name].add_call(duration)
+                add_call(clock() - start_time)
         
         return wrapper
 
@@ -111,12 +164,18 @@ class DataProcessor(metaclass=PerformanceMonitorMeta):
     def analyze_data(self):
         """Simulate analyzing data"""
         time.sleep(0.15)
-        if not self.data:
+        data = self.data
+        if len(data) == 0:
             return {}
+        # An array keeps raw numbers and reduces them in C with its own
+        # methods; for a list, three builtin passes are cheaper than
+        # converting it first
+        if np is not None and isinstance(data, np.ndarray):
+            return {'mean': data.mean(), 'max': data.max(), 'min': data.min()}
         return {
-            'mean': sum(self.data) / len(self.data),
-            'max': max(self.data),
-            'min': min(self.data)
+            'mean': sum(data) / len(data),
+            'max': max(data),
+            'min': min(data)
         }
     
     def save_results(self, results):
@@ -141,10 +200,8 @@ class Calculator(metaclass=PerformanceMonitorMeta):
         time.sleep(0.05)
         if n <= 1:
             return 1
-        result = 1
-        for i in range(2, n + 1):
-            result *= i
-        return result
+        # math.factorial runs in C and stays exact for any n (Python ints)
+        return math.factorial(n)
 
 if __name__ == "__main__":
     # Test DataProcessor
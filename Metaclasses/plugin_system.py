@@ -3,9 +3,15 @@ CONCEPT: Auto-registering plugin system
 LEARN: Automatic plugin discovery and registration
 """
 
+from types import MappingProxyType
+
 class PluginMeta(type):
     """Metaclass that auto-registers plugins"""
-    plugins = {}
+    _plugins = {}
+    # Read-only view for callers - plugins are only added by defining a class
+    plugins = MappingProxyType(_plugins)
+    # Plugin names in registration order, rebuilt only when one is added
+    _plugin_names = ()
     
     def __new__(cls, name, bases, attrs):
         new_class = super().__new__(cls, name, bases, attrs)
@@ -13,7 +19,8 @@ class PluginMeta(type):
         # Don't register the base Plugin class itself
         if name != 'Plugin':
             plugin_name = attrs.get('plugin_name', name)
-            cls.plugins[plugin_name] = new_class
+            PluginMeta._plugins[plugin_name] = new_class
+            PluginMeta._plugin_names = tuple(PluginMeta._plugins)
             print(f"Registered plugin: {plugin_name}")
         
         return new_class
@@ -21,12 +28,14 @@ class PluginMeta(type):
     @classmethod
     def get_plugin(cls, name):
         """Get a plugin by name"""
-        return cls.plugins.get(name)
+        return cls._plugins.get(name)
     
     @classmethod
     def list_plugins(cls):
         """List all registered plugins"""
-        return list(cls.plugins.keys())
+        # Lookups far outnumber registrations, so the names are kept ready
+        # (returned as a list, as before)
+        return list(cls._plugin_names)
 
 class Plugin(metaclass=PluginMeta):
     """Base plugin class"""
@@ -7,57 +7,66 @@ import json
 from datetime import datetime
 from typing import get_type_hints
 
+# Values of exactly these types are stored in the JSON as they are
+_JSON_SCALARS = frozenset({str, int, float, bool, type(None)})
+
+def _to_json(self):
+    """Convert the instance to a JSON-ready dict"""
+    data = {'__class__': self.__class__.__name__}
+    
+    for key, value in self.__dict__.items():
+        # Most attributes are plain strings/numbers: one set lookup on
+        # the exact type, skipping the isinstance/hasattr checks
+        if type(value) in _JSON_SCALARS:
+            data[key] = value
+        elif isinstance(value, datetime):
+            data[key] = {'__type__': 'datetime', 'value': value.isoformat()}
+        elif hasattr(value, 'to_json'):
+            data[key] = value.to_json()
+        else:
+            data[key] = value
+    
+    return data
+
+def _from_json(cls, data):
+    """Build an instance from a dict made by to_json()"""
+    if '__class__' in data:
+        class_name = data.pop('__class__')
+    
+    instance = cls.__new__(cls)
+    
+    for key, value in data.items():
+        if isinstance(value, dict) and '__type__' in value:
+            if value['__type__'] == 'datetime':
+                setattr(instance, key, datetime.fromisoformat(value['value']))
+        else:
+            setattr(instance, key, value)
+    
+    return instance
+
+def _save(self, filename):
+    """Write the instance to a JSON file"""
+    # dumps() + one write - json.dump() writes every small piece separately
+    with open(filename, 'w') as f:
+        f.write(json.dumps(self.to_json(), indent=2))
+
+def _load(cls, filename):
+    """Read an instance back from a JSON file"""
+    with open(filename, 'r') as f:
+        data = json.load(f)
+    return cls.from_json(data)
+
 class SerializableMeta(type):
     """Metaclass for automatic JSON serialization"""
     
     def __new__(cls, name, bases, attrs):
-        # Add to_json method
-        def to_json(self):
-            data = {'__class__': self.__class__.__name__}
-            
-            for key, value in self.__dict__.items():
-                if isinstance(value, datetime):
-                    data[key] = {'__type__': 'datetime', 'value': value.isoformat()}
-                elif hasattr(value, 'to_json'):
-                    data[key] = value.to_json()
-                else:
-                    data[key] = value
-            
-            return data
-        
-        # Add from_json class method
-        @classmethod
-        def from_json(cls, data):
-            if '__class__' in data:
-                class_name = data.pop('__class__')
-            
-            instance = cls.__new__(cls)
-            
-            for key, value in data.items():
-                if isinstance(value, dict) and '__type__' in value:
-                    if value['__type__'] == 'datetime':
-                        setattr(instance, key, datetime.fromisoformat(value['value']))
-                else:
-                    setattr(instance, key, value)
-            
-            return instance
-        
-        # Add save method
-        def save(self, filename):
-            with open(filename, 'w') as f:
-                json.dump(self.to_json(), f, indent=2)
-        
-        # Add load class method
-        @classmethod
-        def load(cls, filename):
-            with open(filename, 'r') as f:
-                data = json.load(f)
-            return cls.from_json(data)
-        
-        attrs['to_json'] = to_json
-        attrs['from_json'] = from_json
-        attrs['save'] = save
-        attrs['load'] = load
+        # The methods are defined once at module level and shared by every
+        # class, instead of four new functions each time a class is created.
+        # setdefault leaves any version the class defines itself in place
+        attrs.setdefault('to_json', _to_json)
+        attrs.setdefault('from_json', classmethod(_from_json))
+        attrs.setdefault('save', _save)
+        attrs.setdefault('load', classmethod(_load))
         
         return super().__new__(cls, name, bases, attrs)
 
@@ -3,15 +3,29 @@ CONCEPT: Implementing Singleton pattern
 LEARN: Control instance creation with metaclass
 """
 
+import threading
+
 class SingletonMeta(type):
     """Metaclass that creates a Singleton"""
-    _instances = {}
+    
+    def __init__(cls, name, bases, attrs):
+        super().__init__(name, bases, attrs)
+        # Each class keeps its own instance - set here so subclasses don't
+        # share their parent's
+        cls._instance = None
+        cls._singleton_lock = threading.Lock()
     
     def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            instance = super().__call__(*args, **kwargs)
-            cls._instances[cls] = instance
-        return cls._instances[cls]
+        # After the first call this is a single attribute read
+        instance = cls._instance
+        if instance is None:
+            # Check again under the lock so two threads can't both create one
+            with cls._singleton_lock:
+                instance = cls._instance
+                if instance is None:
+                    instance = super().__call__(*args, **kwargs)
+                    cls._instance = instance
+        return instance
 
 class Database(metaclass=SingletonMeta):
     def __init__(self, connection_string):
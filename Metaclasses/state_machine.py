@@ -4,6 +4,7 @@ LEARN: Finite state machine with automatic transition validation
 """
 
 import functools
+from array import array
 from enum import Enum
 
 class Transition:
@@ -65,9 +66,20 @@ class StateMachineMeta(type):
                 on_exit_handlers[state].append(attr_name)
         
         attrs['_transitions'] = transitions
+        
+        # Target states reachable from each state, grouped once here so
+        # get_available_transitions doesn't scan every transition
+        outgoing = {}
+        for from_state, to_state in transitions:
+            outgoing.setdefault(from_state, []).append(to_state)
+        attrs['_outgoing'] = {state: tuple(targets) for state, targets in outgoing.items()}
         attrs['_on_enter_handlers'] = on_enter_handlers
         attrs['_on_exit_handlers'] = on_exit_handlers
         
+        # Transitions are only printed when a class asks for it - printing
+        # costs far more than the state bookkeeping itself
+        attrs.setdefault('_verbose', False)
+        
         # Override __init__ to set initial state
         original_init = attrs.get('__init__')
         
@@ -81,10 +93,12 @@ class StateMachineMeta(type):
                 if initial_state is None:
                     raise ValueError(f"Class {name} must define 'initial_state'")
                 self._current_state = initial_state
-                self._state_history = [initial_state]
+                self._state_history = array(
+                    self._history_typecode, (self._state_index[initial_state],)
+                )
                 
                 # Call on_enter handlers for initial state
-                self._call_handlers(self._on_enter_handlers, initial_state)
+                self._call_handlers(self._on_enter_funcs, initial_state)
         
         attrs['__init__'] = new_init
         
@@ -96,34 +110,33 @@ class StateMachineMeta(type):
             return (self._current_state, to_state) in self._transitions
         
         def get_available_transitions(self):
-            available = []
-            for (from_state, to_state), method_name in self._transitions.items():
-                if from_state == self._current_state:
-                    available.append(to_state)
-            return available
+            # A new list each time, so callers can't change the shared tuple
+            return list(self._outgoing.get(self._current_state, ()))
         
-        def _call_handlers(self, handlers_dict, state):
-            if state in handlers_dict:
-                for handler_name in handlers_dict[state]:
-                    handler = getattr(self, handler_name)
-                    handler()
+        def _call_handlers(self, funcs_dict, state):
+            # One dict lookup gives the functions ready to call - no
+            # membership test and no getattr() by name for each handler
+            for handler in funcs_dict.get(state, ()):
+                handler(self)
         
         def _perform_transition(self, to_state, method_name):
             # Call on_exit handlers for current state
-            self._call_handlers(self._on_exit_handlers, self._current_state)
+            self._call_handlers(self._on_exit_funcs, self._current_state)
             
             # Update state
             old_state = self._current_state
             self._current_state = to_state
-            self._state_history.append(to_state)
+            self._state_history.append(self._state_index[to_state])
             
             # Call on_enter handlers for new state
-            self._call_handlers(self._on_enter_handlers, to_state)
+            self._call_handlers(self._on_enter_funcs, to_state)
             
-            print(f"State transition: {old_state} -> {to_state}")
+            if self._verbose:
+                print(f"State transition: {old_state} -> {to_state}")
         
         def get_state_history(self):
-            return self._state_history.copy()
+            state_list = self._state_list
+            return [state_list[i] for i in self._state_history]
         
         attrs['get_current_state'] = get_current_state
         attrs['can_transition'] = can_transition
@@ -139,9 +152,13 @@ class StateMachineMeta(type):
             def make_wrapper(orig_method, f_state, t_state, m_name):
                 @functools.wraps(orig_method)
                 def wrapper(self, *args, **kwargs):
-                    if self._current_state != f_state:
+                    # States are usually Enum members (one object per
+                    # value), so an identity test settles the common case;
+                    # != is still the rule for other state values
+                    current_state = self._current_state
+                    if current_state is not f_state and current_state != f_state:
                         raise ValueError(
-                            f"Cannot call {m_name} in state {self._current_state}. "
+                            f"Cannot call {m_name} in state {current_state}. "
                             f"Expected state: {f_state}"
                         )
                     
@@ -157,7 +174,39 @@ class StateMachineMeta(type):
             
             attrs[method_name] = make_wrapper(original_method, from_state, to_state, method_name)
         
-        return super().__new__(cls, name, bases, attrs)
+        # Handler functions per state, looked up by name once here (after
+        # the wrapping above, so a handler that is also a transition gets
+        # its wrapped version)
+        attrs['_on_enter_funcs'] = {
+            state: tuple(attrs[n] for n in names)
+            for state, names in on_enter_handlers.items()
+        }
+        attrs['_on_exit_funcs'] = {
+            state: tuple(attrs[n] for n in names)
+            for state, names in on_exit_handlers.items()
+        }
+        
+        new_class = super().__new__(cls, name, bases, attrs)
+        
+        # The history is kept as an array of small ints - one byte per entry
+        # for up to 256 states - instead of a list of object references.
+        # Every state the machine can reach gets an index: the base classes'
+        # states, the initial state and both ends of each transition
+        states = {}
+        for base in bases:
+            for state in getattr(base, '_state_list', ()):
+                states.setdefault(state)
+        initial_state = getattr(new_class, 'initial_state', None)
+        if initial_state is not None:
+            states.setdefault(initial_state)
+        for from_state, to_state in transitions:
+            states.setdefault(from_state)
+            states.setdefault(to_state)
+        new_class._state_list = tuple(states)
+        new_class._state_index = {state: i for i, state in enumerate(new_class._state_list)}
+        new_class._history_typecode = 'B' if len(states) <= 256 else 'I'
+        
+        return new_class
 
 # Example: Order State Machine
 class OrderState(Enum):
@@ -240,6 +289,10 @@ class TrafficLight(metaclass=StateMachineMeta):
         return "STOP"
 
 if __name__ == "__main__":
+    # Show each transition as it happens
+    Order._verbose = True
+    TrafficLight._verbose = True
+    
     print("=== Order State Machine ===")
     order = Order("ORD-123", ["Item1", "Item2"])
     
@@ -19,6 +19,21 @@ Validation Strategy:
 
 import re
 
+# Patterns are compiled once here; each call then goes straight to the
+# compiled pattern instead of looking it up in re's internal cache
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_PHONE_RE = re.compile(r'^(\(\d{3}\)\s*|\d{3}[-.]?)\d{3}[-.]?\d{4}$')
+_URL_RE = re.compile(r'^https?://[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}(/.*)?$')
+_IP_RE = re.compile(r'^((25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$')
+_DATE_RE = re.compile(r'^(19|20)\d{2}-(0[1-9]|1[0-2])-(0[1-9]|[12][0-9]|3[01])$')
+_UPPERCASE = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+_LOWERCASE = frozenset('abcdefghijklmnopqrstuvwxyz')
+_SPECIAL_CHARS = frozenset('!@#$%^&*(),.?":{}|<>')
+_DIGIT_RE = re.compile(r'\d')  # \d also matches non-ASCII digits
+_USERNAME_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9_-]{2,15}$')
+_CARD_SEPARATORS_RE = re.compile(r'[\s-]')
+_CARD_RE = re.compile(r'^\d{13,19}$')
+
 print("="*70)
 print("Program 7: ADVANCED VALIDATION")
 print("="*70)
@@ -29,8 +44,7 @@ def validate_email(email):
     Validate email address
     Pattern: username@domain.tld
     """
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.fullmatch(pattern, email) is not None
+    return _EMAIL_RE.fullmatch(email) is not None
 
 emails = [
     "user@example.com",      # Valid
@@ -52,8 +66,7 @@ def validate_phone(phone):
     Validate phone number
     Formats: (123) 456-7890, 123-456-7890, 123.456.7890
     """
-    pattern = r'^(\(\d{3}\)\s*|\d{3}[-.]?)\d{3}[-.]?\d{4}$'
-    return re.fullmatch(pattern, phone) is not None
+    return _PHONE_RE.fullmatch(phone) is not None
 
 phones = [
     "(123) 456-7890",  # Valid
@@ -75,8 +88,7 @@ def validate_url(url):
     Validate URL
     Pattern: protocol://domain.tld/path
     """
-    pattern = r'^https?://[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}(/.*)?$'
-    return re.fullmatch(pattern, url) is not None
+    return _URL_RE.fullmatch(url) is not None
 
 urls = [
     "http://example.com",           # Valid
@@ -98,8 +110,7 @@ def validate_ip(ip):
     Validate IPv4 address
     Pattern: 0-255.0-255.0-255.0-255
     """
-    pattern = r'^((25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$'
-    return re.fullmatch(pattern, ip) is not None
+    return _IP_RE.fullmatch(ip) is not None
 
 ips = [
     "192.168.1.1",    # Valid
@@ -120,8 +131,7 @@ def validate_date(date):
     """
     Validate date in YYYY-MM-DD format
     """
-    pattern = r'^(19|20)\d{2}-(0[1-9]|1[0-2])-(0[1-9]|[12][0-9]|3[01])$'
-    return re.fullmatch(pattern, date) is not None
+    return _DATE_RE.fullmatch(date) is not None
 
 dates = [
     "2024-12-25",  # Valid
@@ -147,13 +157,15 @@ def validate_password(password):
     - At least one digit
     - At least one special character
     """
-    length_ok = len(password) >= 8
-    has_upper = re.search(r'[A-Z]', password) is not None
-    has_lower = re.search(r'[a-z]', password) is not None
-    has_digit = re.search(r'\d', password) is not None
-    has_special = re.search(r'[!@#$%^&*(),.?":{}|<>]', password) is not None
-    
-    return all([length_ok, has_upper, has_lower, has_digit, has_special])
+    if len(password) < 8:
+        return False
+    # One pass over the password builds its set of characters; each
+    # class check is then a set intersection test instead of a regex scan
+    chars = set(password)
+    return (not chars.isdisjoint(_UPPERCASE)
+            and not chars.isdisjoint(_LOWERCASE)
+            and not chars.isdisjoint(_SPECIAL_CHARS)
+            and _DIGIT_RE.search(password) is not None)
 
 passwords = [
     "Secure123!",      # Valid
@@ -177,8 +189,7 @@ def validate_username(username):
     - Letters, numbers, underscore, hyphen
     - Must start with letter
     """
-    pattern = r'^[a-zA-Z][a-zA-Z0-9_-]{2,15}$'
-    return re.fullmatch(pattern, username) is not None
+    return _USERNAME_RE.fullmatch(username) is not None
 
 usernames = [
     "user123",      # Valid
@@ -201,10 +212,9 @@ def validate_credit_card(card):
     Accepts: 1234-5678-9012-3456 or 1234567890123456
     """
     # Remove spaces and hyphens
-    clean_card = re.sub(r'[\s-]', '', card)
+    clean_card = _CARD_SEPARATORS_RE.sub('', card)
     # Check if 13-19 digits
-    pattern = r'^\d{13,19}$'
-    return re.fullmatch(pattern, clean_card) is not None
+    return _CARD_RE.fullmatch(clean_card) is not None
 
 cards = [
     "1234-5678-9012-3456",  # Valid